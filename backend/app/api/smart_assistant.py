@@ -7,6 +7,7 @@ Main router for Smart Assistant functionality, including:
 - Intelligence briefing
 """
 
+import asyncio
 import logging
 from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Request, UploadFile, File, Form, Header, Response
 from typing import Dict, List, Optional, Any, Set
@@ -295,12 +296,17 @@ async def process_jobs_with_ai(
             logger.info("All jobs were duplicates, no processing needed")
             return
         
-        processed_jobs = []
-        filtered_jobs = []
-        
         logger.info(f"Processing {len(new_jobs)} new jobs with AI analysis...")
         
-        for i, job in enumerate(new_jobs, 1):
+        # Gemini calls are independent per job, so run them concurrently while
+        # capping in-flight requests to stay within provider quotas
+        semaphore = asyncio.Semaphore(max(1, settings.GEMINI_MAX_CONCURRENCY))
+        
+        async def _bounded(coro):
+            async with semaphore:
+                return await coro
+        
+        async def _analyze_one(i: int, job: Dict[str, Any]) -> Dict[str, Any]:
             processed_job = job.copy()
             
             logger.info(f"Processing job {i}/{len(new_jobs)}: {job.get('title')} at {job.get('company')}")
@@ -317,32 +323,6 @@ async def process_jobs_with_ai(
                         processed_job["relevance_score"] = relevance_score
                         
                         logger.info(f"Job relevance score: {relevance_score:.2f} for {job.get('title')}")
-                        
-                        # Only process further if relevance score meets threshold
-                        if relevance_score >= min_relevance_score:
-                            logger.info(f"✅ Job passes relevance filter ({relevance_score:.2f} >= {min_relevance_score})")
-                            
-                            # Generate cover letter for high-relevance jobs
-                            if generate_cover_letters and gemini_client.is_configured():
-                                try:
-                                    cover_letter_result = await gemini_client.generate_cover_letter(
-                                        job_title=job.get("title", ""),
-                                        company=job.get("company", ""),
-                                        job_description=job.get("description", "")
-                                    )
-                                    processed_job["cover_letter"] = cover_letter_result
-                                    logger.info(f"Generated cover letter for {job.get('title')}")
-                                except Exception as e:
-                                    logger.error(f"Failed to generate cover letter for {job.get('title')}: {e}")
-                                    processed_job["cover_letter"] = {
-                                        "success": False,
-                                        "error": str(e),
-                                        "cover_letter": ""
-                                    }
-                            
-                            filtered_jobs.append(processed_job)
-                        else:
-                            logger.info(f"❌ Job filtered out ({relevance_score:.2f} < {min_relevance_score})")
                     else:
                         logger.warning(f"Failed to get relevance score for {job.get('title')}")
                         processed_job["relevance_score"] = 0.0
@@ -357,7 +337,45 @@ async def process_jobs_with_ai(
             else:
                 processed_job["relevance_score"] = 0.0
             
-            processed_jobs.append(processed_job)
+            return processed_job
+        
+        async def _cover_one(processed_job: Dict[str, Any]) -> None:
+            try:
+                cover_letter_result = await gemini_client.generate_cover_letter(
+                    job_title=processed_job.get("title", ""),
+                    company=processed_job.get("company", ""),
+                    job_description=processed_job.get("description", "")
+                )
+                processed_job["cover_letter"] = cover_letter_result
+                logger.info(f"Generated cover letter for {processed_job.get('title')}")
+            except Exception as e:
+                logger.error(f"Failed to generate cover letter for {processed_job.get('title')}: {e}")
+                processed_job["cover_letter"] = {
+                    "success": False,
+                    "error": str(e),
+                    "cover_letter": ""
+                }
+        
+        processed_jobs = await asyncio.gather(
+            *[_bounded(_analyze_one(i, job)) for i, job in enumerate(new_jobs, 1)]
+        )
+        
+        # Only process further if relevance score meets threshold
+        filtered_jobs = []
+        for processed_job in processed_jobs:
+            analysis_result = processed_job.get("job_analysis") or {}
+            if not (analysis_result.get("success") and "analysis" in analysis_result):
+                continue
+            relevance_score = processed_job["relevance_score"]
+            if relevance_score >= min_relevance_score:
+                logger.info(f"✅ Job passes relevance filter ({relevance_score:.2f} >= {min_relevance_score})")
+                filtered_jobs.append(processed_job)
+            else:
+                logger.info(f"❌ Job filtered out ({relevance_score:.2f} < {min_relevance_score})")
+        
+        # Generate cover letters for high-relevance jobs
+        if generate_cover_letters and gemini_client.is_configured() and filtered_jobs:
+            await asyncio.gather(*[_bounded(_cover_one(job)) for job in filtered_jobs])
         
         logger.info(f"Filtered {len(filtered_jobs)} out of {len(new_jobs)} jobs (relevance >= {min_relevance_score})")
         
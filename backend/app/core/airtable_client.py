@@ -4,15 +4,31 @@ Airtable Client for Smart Assistant
 Handles integration with Airtable for storing job data and other records.
 """
 
+import asyncio
 import logging
+from datetime import datetime
 from typing import List, Dict, Any, Optional
 from pyairtable import Api
 import structlog
 
 from app.core.config import settings
+from app.core.rate_limit import TokenBucket
 
 logger = structlog.get_logger()
 
+# Airtable accepts at most 10 records per create request and 5 requests/sec per base
+AIRTABLE_BATCH_SIZE = 10
+AIRTABLE_MAX_CONCURRENCY = 5
+AIRTABLE_REQUESTS_PER_SECOND = 5.0
+
+# Job dict key -> Airtable field copied verbatim into every record
+_BASE_FIELD_PROJECTION = (
+    ("Job Title", "title"),
+    ("Company", "company"),
+    ("Location", "location"),
+    ("URL", "url"),
+)
+
 
 class AirtableClient:
     """
@@ -21,6 +37,9 @@ class AirtableClient:
     
     def __init__(self):
         """Initialize the Airtable client with configuration from settings."""
+        self.table = None
+        self._rate_limiter = TokenBucket(AIRTABLE_REQUESTS_PER_SECOND)
+        
         if not settings.AIRTABLE_API_KEY:
             logger.warning("Airtable API key not configured")
             self.api = None
@@ -70,88 +89,21 @@ class AirtableClient:
             }
         
         try:
-            # Prepare records for Airtable
-            records = []
-            for job in jobs:
-                # Calculate days posted if possible
-                days_posted = None
-                if job.get("posted_at"):
-                    try:
-                        from datetime import datetime
-                        posted_date = datetime.fromisoformat(job["posted_at"].replace('Z', '+00:00'))
-                        current_date = datetime.now(posted_date.tzinfo)
-                        days_posted = (current_date - posted_date).days
-                    except Exception as e:
-                        logger.warning(f"Could not calculate days posted: {e}")
-                
-                # Map job fields to Airtable fields based on the table schema
-                record = {
-                    "Job Title": job.get("title", ""),
-                    "Company": job.get("company", ""),
-                    "Location": job.get("location", ""),
-                    "URL": job.get("url", ""),
-                    "Description": job.get("description", "")[:1000],  # Limit description length
-                }
-                
-                # Add date fields in proper format
-                if job.get("posted_at"):
-                    try:
-                        from datetime import datetime
-                        posted_date = datetime.fromisoformat(job["posted_at"].replace('Z', '+00:00'))
-                        record["Posted Date"] = posted_date.strftime('%Y-%m-%d')
-                    except Exception as e:
-                        logger.warning(f"Could not format posted date: {e}")
-                
-                if job.get("scraped_at"):
-                    try:
-                        from datetime import datetime
-                        scraped_date = datetime.fromisoformat(job["scraped_at"].replace('Z', '+00:00'))
-                        record["Scraped Date"] = scraped_date.strftime('%Y-%m-%d')  # Use simple date format
-                    except Exception as e:
-                        logger.warning(f"Could not format scraped date: {e}")
-                
-                # Add optional fields if they exist in the schema
-                if job.get("relevance_score"):
-                    record["Relevance Score"] = float(job.get("relevance_score", 0.0))
-                    
-                if job.get("source"):
-                    record["Source"] = job.get("source", "linkedin")
-                    
-                if job.get("id"):
-                    record["Job ID"] = job.get("id", "")
-                
-                # Add cover letter if generated
-                if job.get("cover_letter") and job["cover_letter"].get("success"):
-                    record["Cover Letter"] = job["cover_letter"].get("cover_letter", "")
-                
-                # Add job analysis fields if available
-                if job.get("job_analysis") and job["job_analysis"].get("success"):
-                    analysis_data = job["job_analysis"].get("analysis", {})
-                    record["Salary Range"] = analysis_data.get("salary_range", "")
-                    record["Education Requirements"] = analysis_data.get("education_requirements", "")
-                
-                records.append(record)
-                logger.debug(f"Successfully created record for job: {record['Job Title']}")
-            
+            records = [self._job_to_record(job) for job in jobs]
             logger.info(f"Prepared {len(records)} records for Airtable")
             
-            # Batch create records in Airtable (max 10 at a time)
-            batch_size = 10
-            created_records = []
-            
-            for i in range(0, len(records), batch_size):
-                batch = records[i:i + batch_size]
-                try:
-                    batch_result = self.table.batch_create(batch)
-                    if batch_result and isinstance(batch_result, list):
-                        created_records.extend(batch_result)
-                        logger.info(f"Added {len(batch_result)} job records to Airtable (batch {i//batch_size + 1})")
-                    else:
-                        logger.warning(f"Batch create returned unexpected result: {batch_result}")
-                except Exception as batch_error:
-                    logger.error(f"Error creating batch {i//batch_size + 1}: {batch_error}")
-                    # Continue with next batch
-                    continue
+            # Post 10-record batches concurrently; the semaphore and token bucket
+            # keep us under Airtable's 5 req/s cap up front instead of relying on 429 retries
+            batches = [
+                records[i:i + AIRTABLE_BATCH_SIZE]
+                for i in range(0, len(records), AIRTABLE_BATCH_SIZE)
+            ]
+            semaphore = asyncio.Semaphore(AIRTABLE_MAX_CONCURRENCY)
+            results = await asyncio.gather(*[
+                self._create_batch(batch_no, batch, semaphore)
+                for batch_no, batch in enumerate(batches, 1)
+            ])
+            created_records = [record for batch_result in results for record in batch_result]
             
             logger.info(f"Successfully added {len(created_records)} job records to Airtable")
             
@@ -177,6 +129,73 @@ class AirtableClient:
             logger.error(f"Error adding jobs to Airtable: {e}")
             raise Exception(f"Failed to add jobs to Airtable: {str(e)}")
     
+    async def _create_batch(
+        self,
+        batch_no: int,
+        batch: List[Dict[str, Any]],
+        semaphore: asyncio.Semaphore
+    ) -> List[Dict[str, Any]]:
+        """Create one batch of records, returning the created records (empty on failure)."""
+        async with semaphore:
+            await self._rate_limiter.acquire()
+            try:
+                # pyairtable is synchronous (and retries 429s with backoff itself),
+                # so run the request in a worker thread to let batches overlap
+                batch_result = await asyncio.to_thread(self.table.batch_create, batch)
+            except Exception as batch_error:
+                logger.error(f"Error creating batch {batch_no}: {batch_error}")
+                return []
+        
+        if batch_result and isinstance(batch_result, list):
+            logger.info(f"Added {len(batch_result)} job records to Airtable (batch {batch_no})")
+            return batch_result
+        
+        logger.warning(f"Batch create returned unexpected result: {batch_result}")
+        return []
+    
+    def _job_to_record(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        """Map a job dictionary to Airtable fields based on the table schema."""
+        record = {field: job.get(key, "") for field, key in _BASE_FIELD_PROJECTION}
+        record["Description"] = (job.get("description") or "")[:1000]  # Limit description length
+        
+        # Add date fields in proper format
+        if job.get("posted_at"):
+            try:
+                posted_date = datetime.fromisoformat(job["posted_at"].replace('Z', '+00:00'))
+                record["Posted Date"] = posted_date.strftime('%Y-%m-%d')
+            except Exception as e:
+                logger.warning(f"Could not format posted date: {e}")
+        
+        if job.get("scraped_at"):
+            try:
+                scraped_date = datetime.fromisoformat(job["scraped_at"].replace('Z', '+00:00'))
+                record["Scraped Date"] = scraped_date.strftime('%Y-%m-%d')  # Use simple date format
+            except Exception as e:
+                logger.warning(f"Could not format scraped date: {e}")
+        
+        # Add optional fields if they exist in the schema
+        if job.get("relevance_score"):
+            record["Relevance Score"] = float(job.get("relevance_score", 0.0))
+            
+        if job.get("source"):
+            record["Source"] = job.get("source", "linkedin")
+            
+        if job.get("id"):
+            record["Job ID"] = job.get("id", "")
+        
+        # Add cover letter if generated
+        if job.get("cover_letter") and job["cover_letter"].get("success"):
+            record["Cover Letter"] = job["cover_letter"].get("cover_letter", "")
+        
+        # Add job analysis fields if available
+        if job.get("job_analysis") and job["job_analysis"].get("success"):
+            analysis_data = job["job_analysis"].get("analysis", {})
+            record["Salary Range"] = analysis_data.get("salary_range", "")
+            record["Education Requirements"] = analysis_data.get("education_requirements", "")
+        
+        logger.debug(f"Successfully created record for job: {record['Job Title']}")
+        return record
+    
     async def get_jobs(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Retrieve job records from Airtable.
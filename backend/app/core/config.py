@@ -43,6 +43,9 @@ class Settings:
     
     # Database settings
     DATABASE_URL: str = os.getenv("DATABASE_URL", "sqlite:///data/webui.db")
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "20"))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", "3600"))
     
     # API settings
     ENABLE_OPENAI_API: bool = os.getenv("ENABLE_OPENAI_API", "true").lower() == "true"
@@ -54,6 +57,8 @@ class Settings:
     # Gemini API settings
     GEMINI_API_KEY: str = os.getenv("GEMINI_API_KEY", "")
     GEMINI_MODEL: str = os.getenv("GEMINI_MODEL", "gemini-1.5-flash")
+    GEMINI_MAX_CONCURRENCY: int = int(os.getenv("GEMINI_MAX_CONCURRENCY", "5"))
+    GEMINI_CONNECTION_LIMIT: int = int(os.getenv("GEMINI_CONNECTION_LIMIT", "20"))
     
     # CV and Cover Letter settings
     CV_DIRECTORY: str = os.getenv("CV_DIRECTORY", "/home/gabe/Documents/Agent Project 2.0/backend/data/cv")
@@ -6,6 +6,7 @@ Provides asynchronous database connection and session handling using SQLAlchemy.
 
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, StaticPool
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 import logging
@@ -19,6 +20,34 @@ logger = logging.getLogger(__name__)
 engine = None
 async_session = None
 
+def _engine_options(database_url: str) -> dict:
+    """Pool options for the given database URL.
+
+    In-memory SQLite must live on a single shared connection; every other
+    backend gets a sized queue pool so sessions reuse warm connections
+    instead of reconnecting per request.
+    """
+    if database_url.startswith('sqlite+') and ':memory:' in database_url:
+        return {
+            "poolclass": StaticPool,
+            "connect_args": {"check_same_thread": False},
+        }
+
+    options = {
+        "poolclass": AsyncAdaptedQueuePool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_pre_ping": True,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+    }
+    if database_url.startswith('sqlite+'):
+        options["connect_args"] = {"check_same_thread": False}
+    elif database_url.startswith('postgresql+asyncpg'):
+        # asyncpg's own statement cache; SQLAlchemy's prepared statement
+        # cache is configured through the URL (prepared_statement_cache_size)
+        options["connect_args"] = {"statement_cache_size": 1024}
+    return options
+
 async def init_db():
     """Initialize the database connection."""
     global engine, async_session
@@ -29,14 +58,22 @@ async def init_db():
     if database_url.startswith('sqlite:'):
         database_url = database_url.replace('sqlite:', 'sqlite+aiosqlite:')
     
+    if database_url.startswith('postgresql+asyncpg') and 'prepared_statement_cache_size' not in database_url:
+        separator = '&' if '?' in database_url else '?'
+        database_url = f"{database_url}{separator}prepared_statement_cache_size=512"
+    
     logger.info(f"Initializing database connection to {database_url.split('@')[0]}...")
     
+    # Release the previous pool when re-initialising (tests call init_db repeatedly)
+    if engine is not None:
+        await engine.dispose()
+    
     # Create async engine
     engine = create_async_engine(
         database_url,
         echo=False,
         future=True,
-        pool_pre_ping=True,
+        **_engine_options(database_url),
     )
     
     # Create async session factory
@@ -9,16 +9,43 @@ import logging
 from typing import Dict, Any, Optional, List
 import aiohttp
 import asyncio
+import hashlib
 import json
 import structlog
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 from datetime import datetime
 
 from app.core.config import settings
 from app.core.cv_manager import cv_manager
+from app.core import database
+from app.models.database import LLMCacheEntry
+
+try:  # Optional orjson (C encoder); stdlib json is the fallback
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore
 
 logger = structlog.get_logger()
 
 
+def _json_dumps(obj: Any) -> str:
+    """Serialize a request body, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj)
+
+
+def _json_loads(data: Any) -> Any:
+    """Parse a response body, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+# In-memory LRU size in front of the persistent llm_cache table
+LLM_CACHE_MAXSIZE = 1024
+
+
 class GeminiClient:
     """
     Client for interacting with Google's Gemini API.
@@ -29,6 +56,9 @@ class GeminiClient:
         self.api_key = settings.GEMINI_API_KEY
         self.model = settings.GEMINI_MODEL
         self.base_url = "https://generativelanguage.googleapis.com/v1beta"
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._llm_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
         
         if not self.api_key:
             logger.warning("Gemini API key not configured")
@@ -37,6 +67,70 @@ class GeminiClient:
         """Check if Gemini is properly configured."""
         return bool(self.api_key)
 
+    @asynccontextmanager
+    async def _client_session(self):
+        """Yield the shared HTTP session, creating it on first use.
+
+        Reusing one session keeps TLS connections to the API warm across
+        concurrent calls. The session is rebuilt if it was closed or belongs
+        to a different event loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=settings.GEMINI_CONNECTION_LIMIT),
+                json_serialize=_json_dumps,
+            )
+            self._session_loop = loop
+        yield self._session
+
+    def _cache_key(self, kind: str, prompt: str) -> str:
+        """Content-addressed key for a prompt sent to the configured model."""
+        return hashlib.sha256(f"{kind}\0{self.model}\0{prompt}".encode("utf-8")).hexdigest()
+
+    async def _cache_get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Look up a cached response in memory, then in the llm_cache table."""
+        if key in self._llm_cache:
+            self._llm_cache.move_to_end(key)
+            return self._llm_cache[key]
+        if database.async_session is None:
+            return None
+        try:
+            async with database.get_db_session() as session:
+                entry = await session.get(LLMCacheEntry, key)
+                payload = entry.payload if entry is not None else None
+        except Exception as e:
+            logger.warning(f"LLM cache lookup failed: {e}")
+            return None
+        if payload is not None:
+            self._remember(key, payload)
+        return payload
+
+    async def _cache_put(self, key: str, kind: str, payload: Dict[str, Any]) -> None:
+        """Store a successful response in memory and in the llm_cache table."""
+        self._remember(key, payload)
+        if database.async_session is None:
+            return
+        try:
+            async with database.get_db_session() as session:
+                await session.merge(LLMCacheEntry(hash=key, kind=kind, payload=payload))
+                await session.commit()
+        except Exception as e:
+            logger.warning(f"LLM cache write failed: {e}")
+
+    def _remember(self, key: str, payload: Dict[str, Any]) -> None:
+        self._llm_cache[key] = payload
+        self._llm_cache.move_to_end(key)
+        while len(self._llm_cache) > LLM_CACHE_MAXSIZE:
+            self._llm_cache.popitem(last=False)
+
+    async def close(self):
+        """Close the shared HTTP session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._session_loop = None
+
     async def _post_json(self, url: str, payload: dict, *, timeout: float = 20.0, max_retries: int = 2) -> Optional[dict]:
         """Internal helper to POST JSON with simple exponential backoff and timeout."""
         if not self.is_configured():
@@ -44,13 +138,13 @@ class GeminiClient:
         backoff = 1.0
         for attempt in range(max_retries + 1):
             try:
-                async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=timeout)) as session:
-                    async with session.post(url, headers={"Content-Type": "application/json"}, params={"key": self.api_key}, json=payload) as resp:
+                async with self._client_session() as session:
+                    async with session.post(url, headers={"Content-Type": "application/json"}, params={"key": self.api_key}, json=payload, timeout=aiohttp.ClientTimeout(total=timeout)) as resp:
                         if resp.status != 200:
                             text = await resp.text()
                             logger.warning("gemini_http_error status=%d body=%s attempt=%d", resp.status, text[:300], attempt)
                         else:
-                            return await resp.json()
+                            return await resp.json(loads=_json_loads)
             except asyncio.TimeoutError:
                 logger.warning("gemini_timeout attempt=%d", attempt)
             except Exception as e:
@@ -85,7 +179,7 @@ class GeminiClient:
                 return {"success": False, "error": "No candidates in response"}
             content = result["candidates"][0]["content"]["parts"][0]["text"].strip()
             content = content.replace("```json", "").replace("```", "").strip()
-            data = json.loads(content)
+            data = _json_loads(content)
             entities = data.get("entities", [])
             relations = data.get("relations", [])
             return {"success": True, "entities": entities, "relations": relations}
@@ -175,7 +269,7 @@ Extract now:
 
         try:
             # Call Gemini API
-            async with aiohttp.ClientSession() as session:
+            async with self._client_session() as session:
                 url = f"{self.base_url}/models/{self.model}:generateContent"
                 
                 headers = {
@@ -204,7 +298,7 @@ Extract now:
                 
                 async with session.post(url, headers=headers, params=params, json=payload) as response:
                     if response.status == 200:
-                        result = await response.json()
+                        result = await response.json(loads=_json_loads)
                         
                         if "candidates" in result and len(result["candidates"]) > 0:
                             content = result["candidates"][0]["content"]["parts"][0]["text"].strip()
@@ -226,7 +320,7 @@ Extract now:
                                 json_str = content
                             
                             try:
-                                extracted_data = json.loads(json_str)
+                                extracted_data = _json_loads(json_str)
                                 
                                 # Validate required fields
                                 result_data = {
@@ -383,9 +477,15 @@ You are an expert career advisor and professional writer. Generate a personalize
 Please generate the cover letter now:
 """
 
+        cache_key = self._cache_key("generate_cover_letter", prompt)
+        cached = await self._cache_get(cache_key)
+        if cached is not None:
+            logger.info(f"Using cached cover letter for {job_title} at {company}")
+            return cached
+
         try:
             # Call Gemini API
-            async with aiohttp.ClientSession() as session:
+            async with self._client_session() as session:
                 url = f"{self.base_url}/models/{self.model}:generateContent"
                 
                 headers = {
@@ -413,7 +513,7 @@ Please generate the cover letter now:
                 
                 async with session.post(url, headers=headers, json=data, params=params) as response:
                     if response.status == 200:
-                        result = await response.json()
+                        result = await response.json(loads=_json_loads)
                         
                         # Extract generated text from Gemini response
                         if "candidates" in result and len(result["candidates"]) > 0:
@@ -423,13 +523,15 @@ Please generate the cover letter now:
                                 
                                 logger.info(f"Successfully generated cover letter for {job_title} at {company}")
                                 
-                                return {
+                                cover_letter = {
                                     "success": True,
                                     "cover_letter": generated_text.strip(),
                                     "generated_at": datetime.now().isoformat(),
                                     "job_title": job_title,
                                     "company": company
                                 }
+                                await self._cache_put(cache_key, "generate_cover_letter", cover_letter)
+                                return cover_letter
                         
                         # If we get here, the response format was unexpected
                         logger.error(f"Unexpected Gemini API response format: {result}")
@@ -511,8 +613,14 @@ Focus on extracting salary and education information accurately. If salary is me
 Analyze now:
 """
 
+        cache_key = self._cache_key("analyze_job_posting", prompt)
+        cached = await self._cache_get(cache_key)
+        if cached is not None:
+            logger.info("Using cached job posting analysis")
+            return cached
+
         try:
-            async with aiohttp.ClientSession() as session:
+            async with self._client_session() as session:
                 url = f"{self.base_url}/models/{self.model}:generateContent"
                 
                 headers = {
@@ -539,7 +647,7 @@ Analyze now:
                 
                 async with session.post(url, headers=headers, json=data, params=params) as response:
                     if response.status == 200:
-                        result = await response.json()
+                        result = await response.json(loads=_json_loads)
                         
                         if "candidates" in result and len(result["candidates"]) > 0:
                             candidate = result["candidates"][0]
@@ -555,13 +663,15 @@ Analyze now:
                                     if cleaned_text.endswith("```"):
                                         cleaned_text = cleaned_text[:-3]
                                     
-                                    analysis = json.loads(cleaned_text.strip())
+                                    analysis = _json_loads(cleaned_text.strip())
                                     
                                     logger.info("Successfully analyzed job posting with Gemini")
-                                    return {
+                                    analysis_result = {
                                         "success": True,
                                         "analysis": analysis
                                     }
+                                    await self._cache_put(cache_key, "analyze_job_posting", analysis_result)
+                                    return analysis_result
                                 except json.JSONDecodeError as e:
                                     logger.error(f"Failed to parse Gemini analysis as JSON: {e}")
                                     return {
@@ -633,16 +743,16 @@ Analyze now:
             text = result["candidates"][0]["content"]["parts"][0]["text"].strip()
             # Clean markdown fences
             cleaned = text.replace("```json", "").replace("```", "").strip()
-            import json as _json, re as _re
+            import re as _re
             # Attempt direct JSON parse
             try:
-                data = _json.loads(cleaned)
+                data = _json_loads(cleaned)
             except Exception:
                 # Try to locate a JSON object substring
                 m = _re.search(r"\{.*?\}" , cleaned, _re.DOTALL)
                 if m:
                     try:
-                        data = _json.loads(m.group(0))
+                        data = _json_loads(m.group(0))
                     except Exception:
                         data = {}
                 else:
@@ -38,9 +38,62 @@ try:  # Optional Neo4j
 except Exception:  # pragma: no cover
     AsyncGraphDatabase = None  # type: ignore
 
+try:  # Optional networkit (C++/OpenMP centrality); networkx is the fallback
+    import networkit as nk  # type: ignore
+except Exception:  # pragma: no cover
+    nk = None  # type: ignore
+
+try:  # Optional re2 (linear-time DFA matching) for the extraction regexes
+    import re2  # type: ignore
+except Exception:  # pragma: no cover
+    re2 = None  # type: ignore
+
 logger = logging.getLogger(__name__)
 
 
+def _compile_extraction_pattern(pattern: str):
+    """Compile with re2 when available (patterns use inline flags so both engines agree)."""
+    if re2 is not None:
+        try:
+            return re2.compile(pattern)
+        except Exception:  # pragma: no cover - pattern unsupported by re2
+            pass
+    return re.compile(pattern)
+
+
+_CAPITALIZED_RE = _compile_extraction_pattern(r"\b[A-Z][a-zA-Z]{2,}\b")
+_ACRONYM_RE = _compile_extraction_pattern(r"\b[A-Z]{2,}\b")
+_KEYWORD_RE = _compile_extraction_pattern(r"(?i)\b(gradient|descent|optimization|algorithm|parameters|mini-batch|batch|stochastic|momentum)\b")
+_PROPER_PHRASE_RE = _compile_extraction_pattern(r"\b([A-Z][a-z]+(?:\s+[A-Z][a-zA-Z]+){0,3})\b")
+
+
+def _centrality_networkit(node_ids: List[str], edge_pairs: List[Tuple[str, str]], betweenness_k: Optional[int], pagerank: bool = True) -> Tuple[Dict[str, float], Dict[str, float]]:
+    """PageRank + betweenness via networkit. ``betweenness_k`` None = exact, 0 = skip, >0 = sampled;
+    PageRank is skipped (empty) when ``pagerank`` is False."""
+    index = {nid: i for i, nid in enumerate(node_ids)}
+    g = nk.Graph(len(node_ids), weighted=False, directed=False)
+    for src, dst in edge_pairs:
+        u, v = index[src], index[dst]
+        if u != v and not g.hasEdge(u, v):
+            g.addEdge(u, v)
+    pr: Dict[str, float] = {}
+    if pagerank:
+        pr_algo = nk.centrality.PageRank(g, damp=0.85, tol=1e-6)
+        pr_algo.run()
+        pr = dict(zip(node_ids, pr_algo.scores()))
+    btw: Dict[str, float] = {}
+    if betweenness_k is None:
+        b_algo = nk.centrality.Betweenness(g, normalized=True)
+    elif betweenness_k > 0:
+        b_algo = nk.centrality.EstimateBetweenness(g, betweenness_k, normalized=True)
+    else:
+        b_algo = None
+    if b_algo is not None:
+        b_algo.run()
+        btw = dict(zip(node_ids, b_algo.scores()))
+    return pr, btw
+
+
 @dataclass
 class ExtractionResult:
     nodes: List[Dict[str, Any]]
@@ -183,9 +236,9 @@ class GraphRAGService:
             return self._heuristic_extract(text)
 
     def _heuristic_extract(self, text: str) -> ExtractionResult:
-        capitals = re.findall(r"\b[A-Z][a-zA-Z]{2,}\b", text)
-        acronyms = re.findall(r"\b[A-Z]{2,}\b", text)
-        keywords = re.findall(r"\b(gradient|descent|optimization|algorithm|parameters|mini-batch|batch|stochastic|momentum)\b", text, flags=re.IGNORECASE)
+        capitals = _CAPITALIZED_RE.findall(text)
+        acronyms = _ACRONYM_RE.findall(text)
+        keywords = _KEYWORD_RE.findall(text)
         raw = capitals + acronyms + [k.lower() for k in keywords]
         seen: Dict[str, bool] = {}
         ordered: List[str] = []
@@ -279,8 +332,7 @@ class GraphRAGService:
             self._classify_enrich_entities(extraction)
             if not extraction.nodes:
                 # Additional fallback: capture multi-word proper noun phrases
-                import re
-                phrases = re.findall(r"\b([A-Z][a-z]+(?:\s+[A-Z][a-zA-Z]+){0,3})\b", text)
+                phrases = _PROPER_PHRASE_RE.findall(text)
                 uniq: Dict[str,bool] = {}
                 new_nodes: List[Dict[str,Any]] = []
                 for ph in phrases:
@@ -1023,38 +1075,54 @@ class GraphRAGService:
         ns = namespace or settings.DEFAULT_NAMESPACE
         try:
             import networkx as nx
-            from sqlalchemy import select
+            from sqlalchemy import select, update
             from app.core.database import get_db_session
             from app.models.database import GraphNode, GraphEdge
             async with get_db_session() as session:
-                nres = await session.execute(select(GraphNode))
-                nodes = [n for n in nres.scalars().all() if (n.properties or {}).get("namespace") == ns]
+                # Only the columns needed; results are written back with one bulk UPDATE
+                nres = await session.execute(select(GraphNode.id, GraphNode.properties))
+                nodes = [(nid, dict(props or {})) for nid, props in nres.all() if (props or {}).get("namespace") == ns]
                 if not nodes:
                     return {"success": False, "error": "no nodes"}
-                eres = await session.execute(select(GraphEdge))
-                edges = [e for e in eres.scalars().all() if (e.properties or {}).get("namespace") == ns]
-                G = nx.Graph()
-                for e in edges:
-                    G.add_edge(e.source_id, e.target_id)
-                for n in nodes:
-                    if n.id not in G:
-                        G.add_node(n.id)
+                eres = await session.execute(select(GraphEdge.source_id, GraphEdge.target_id, GraphEdge.properties))
+                edge_pairs = [(src, dst) for src, dst, props in eres.all() if (props or {}).get("namespace") == ns]
+                node_ids = list(dict.fromkeys([nid for nid, _ in nodes] + [x for pair in edge_pairs for x in pair]))
+                num_nodes = len(node_ids)
                 # Compute centralities (guard size for betweenness cost)
+                if num_nodes <= 1200:
+                    betweenness_k: Optional[int] = None
+                elif num_nodes <= 8000:
+                    # sample-based approximation for larger graphs
+                    betweenness_k = max(10, int(num_nodes * 0.02))
+                else:
+                    betweenness_k = 0
+                run_pagerank = num_nodes <= 5000
                 pr: Dict[str, float] = {}
                 btw: Dict[str, float] = {}
-                try:
-                    pr = nx.pagerank(G, max_iter=100, alpha=0.85) if G.number_of_nodes() <= 5000 else {}
-                except Exception:
-                    logger.warning("pagerank_failed", exc_info=True)
-                try:
-                    if G.number_of_nodes() <= 1200:
-                        btw = nx.betweenness_centrality(G, k=None, normalized=True)
-                    elif G.number_of_nodes() <= 8000:
-                        # sample-based approximation for larger graphs
-                        k = max(10, int(G.number_of_nodes() * 0.02))
-                        btw = nx.betweenness_centrality(G, k=k, normalized=True, seed=42)
-                except Exception:
-                    logger.warning("betweenness_failed", exc_info=True)
+                used_networkit = False
+                if nk is not None:
+                    try:
+                        pr, btw = _centrality_networkit(node_ids, edge_pairs, betweenness_k, pagerank=run_pagerank)
+                        used_networkit = True
+                    except Exception:
+                        logger.warning("networkit_centrality_failed", exc_info=True)
+                # networkx only when networkit is missing or failed; empty results
+                # from the size guards above are final
+                if not used_networkit:
+                    G = nx.Graph()
+                    G.add_nodes_from(node_ids)
+                    G.add_edges_from(edge_pairs)
+                    try:
+                        pr = nx.pagerank(G, max_iter=100, alpha=0.85) if run_pagerank else {}
+                    except Exception:
+                        logger.warning("pagerank_failed", exc_info=True)
+                    try:
+                        if betweenness_k is None:
+                            btw = nx.betweenness_centrality(G, k=None, normalized=True)
+                        elif betweenness_k > 0:
+                            btw = nx.betweenness_centrality(G, k=betweenness_k, normalized=True, seed=42)
+                    except Exception:
+                        logger.warning("betweenness_failed", exc_info=True)
                 # Normalization helpers
                 def norm(d: Dict[str, float]) -> Dict[str, float]:
                     if not d:
@@ -1067,24 +1135,26 @@ class GraphRAGService:
                 pr_norm = norm(pr)
                 btw_norm = norm(btw)
                 updated = 0
-                for n in nodes:
-                    n.properties = (n.properties or {})
-                    if n.id in pr:
-                        n.properties["pagerank"] = round(pr[n.id], 8)
-                        n.properties["pagerank_norm"] = round(pr_norm.get(n.id, 0.0), 6)
-                    if n.id in btw:
-                        n.properties["betweenness"] = round(btw[n.id], 8)
-                        n.properties["betweenness_norm"] = round(btw_norm.get(n.id, 0.0), 6)
+                rows: List[Dict[str, Any]] = []
+                for nid, props in nodes:
+                    if nid in pr:
+                        props["pagerank"] = round(pr[nid], 8)
+                        props["pagerank_norm"] = round(pr_norm.get(nid, 0.0), 6)
+                    if nid in btw:
+                        props["betweenness"] = round(btw[nid], 8)
+                        props["betweenness_norm"] = round(btw_norm.get(nid, 0.0), 6)
                     # Importance heuristic: average of available normalized metrics (degree_norm already present often)
-                    degn = n.properties.get("degree_norm")
                     parts = []
                     for key in ["pagerank_norm", "betweenness_norm", "degree_norm"]:
-                        v = n.properties.get(key)
+                        v = props.get(key)
                         if isinstance(v, (int, float)):
                             parts.append(float(v))
                     if parts:
-                        n.properties["importance"] = round(sum(parts) / len(parts), 6)
+                        props["importance"] = round(sum(parts) / len(parts), 6)
                         updated += 1
+                    rows.append({"id": nid, "properties": props})
+                if rows:
+                    await session.execute(update(GraphNode), rows)
                 await session.commit()
                 return {"success": True, "nodes_updated": updated, "have_pagerank": bool(pr), "have_betweenness": bool(btw)}
         except Exception as e:
@@ -3,28 +3,204 @@ Job URL Deduplication Service
 
 Provides fast URL-based deduplication for job processing using SQLite database.
 This prevents processing the same job multiple times.
+
+Near-duplicate postings (the same job cross-posted under different URLs) are
+caught with MinHash signatures over (title, company, description) indexed in a
+banded LSH table, so candidate pairs are found without comparing every job.
+
+Exact URL checks ask the database for just the batch's URLs with a single IN
+query, so URLs recorded by other workers or processes are always seen.
 """
 
 import asyncio
-from typing import List, Dict, Any, Set
+import hashlib
+import re
+import unicodedata
+import zlib
+from typing import List, Dict, Any, Set, Optional, Tuple
+import numpy as np
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.dialects.sqlite import insert
 import structlog
 
-from app.models.database import ProcessedJobUrl
+from app.models.database import ProcessedJobUrl, JobSignature
+from app.core import database
 from app.core.database import get_async_session
 
 logger = structlog.get_logger()
 
+# MinHash / LSH parameters: 9 bands x 13 rows puts the LSH S-curve inflection
+# near a Jaccard similarity of 0.84, just above the verification threshold.
+NUM_PERM = 128
+LSH_BANDS = 9
+LSH_ROWS = 13
+SHINGLE_SIZE = 13
+SIMILARITY_THRESHOLD = 0.8
+
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64(0xFFFFFFFF)
+_rng = np.random.default_rng(1)
+_PERM_A = _rng.integers(1, 1 << 32, size=NUM_PERM, dtype=np.uint64)
+_PERM_B = _rng.integers(0, 1 << 32, size=NUM_PERM, dtype=np.uint64)
+_PUNCT_RE = re.compile(r"[^\w\s]+")
+
+
+def _job_tokens(job: Dict[str, Any]) -> List[str]:
+    """NFC-normalize, lowercase and strip punctuation from title, company and description."""
+    text = " ".join(str(job.get(k) or "") for k in ("title", "company", "description"))
+    text = unicodedata.normalize("NFC", text).lower()
+    return _PUNCT_RE.sub(" ", text).split()
+
+
+def _url_hash(url: str) -> str:
+    return hashlib.sha1(url.encode("utf-8")).hexdigest()
+
+
+def compute_signatures(jobs: List[Dict[str, Any]]) -> List[Optional[np.ndarray]]:
+    """
+    Compute MinHash signatures for a batch of jobs in one vectorized pass.
+
+    Jobs with fewer than SHINGLE_SIZE tokens get ``None`` and are only
+    deduplicated by exact URL.
+
+    Returns:
+        One uint32 signature of length NUM_PERM (or None) per job
+    """
+    hashes: List[int] = []
+    offsets: List[int] = []
+    owners: List[int] = []
+    for idx, job in enumerate(jobs):
+        tokens = _job_tokens(job)
+        if len(tokens) < SHINGLE_SIZE:
+            continue
+        shingles = {" ".join(tokens[i:i + SHINGLE_SIZE]) for i in range(len(tokens) - SHINGLE_SIZE + 1)}
+        offsets.append(len(hashes))
+        owners.append(idx)
+        hashes.extend(zlib.crc32(sh.encode("utf-8")) for sh in shingles)
+
+    signatures: List[Optional[np.ndarray]] = [None] * len(jobs)
+    if not owners:
+        return signatures
+
+    hv = np.asarray(hashes, dtype=np.uint64)
+    # (NUM_PERM, total_shingles) permuted hashes, then min per job segment
+    permuted = ((_PERM_A[:, None] * hv[None, :] + _PERM_B[:, None]) % _MERSENNE_PRIME) & _MAX_HASH
+    mins = np.minimum.reduceat(permuted, np.asarray(offsets), axis=1).astype(np.uint32)
+    for col, idx in enumerate(owners):
+        signatures[idx] = np.ascontiguousarray(mins[:, col])
+    return signatures
+
+
+class MinHashLSH:
+    """Banded LSH index over MinHash signatures keyed by URL hash."""
+
+    def __init__(self, bands: int = LSH_BANDS, rows: int = LSH_ROWS, threshold: float = SIMILARITY_THRESHOLD):
+        self.bands = bands
+        self.rows = rows
+        self.threshold = threshold
+        self._buckets: List[Dict[bytes, List[str]]] = [{} for _ in range(bands)]
+        self._signatures: Dict[str, np.ndarray] = {}
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._signatures
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def _band_keys(self, signature: np.ndarray):
+        for b in range(self.bands):
+            yield b, signature[b * self.rows:(b + 1) * self.rows].tobytes()
+
+    def insert(self, key: str, signature: np.ndarray) -> None:
+        if key in self._signatures:
+            return
+        self._signatures[key] = signature
+        for b, band_key in self._band_keys(signature):
+            self._buckets[b].setdefault(band_key, []).append(key)
+
+    def query(self, signature: np.ndarray) -> Optional[str]:
+        """Return the key of a verified near-duplicate, or None."""
+        seen: Set[str] = set()
+        for b, band_key in self._band_keys(signature):
+            for key in self._buckets[b].get(band_key, ()):
+                if key in seen:
+                    continue
+                seen.add(key)
+                similarity = float(np.mean(self._signatures[key] == signature))
+                if similarity >= self.threshold:
+                    return key
+        return None
+
 
 class JobDeduplicationService:
     """Service for tracking and filtering duplicate job URLs."""
-    
+
+    def __init__(self):
+        self._lsh: Optional[MinHashLSH] = None
+        self._lsh_engine = None
+
+    async def lookup_processed_urls(self, urls: List[str]) -> Set[str]:
+        """Return the subset of ``urls`` present in the processed URLs table."""
+        if not urls:
+            return set()
+        try:
+            async with get_async_session() as session:
+                result = await session.execute(select(ProcessedJobUrl.url).where(ProcessedJobUrl.url.in_(urls)))
+                return {row[0] for row in result.fetchall()}
+        except Exception as e:
+            logger.error(f"Error checking processed URLs: {e}")
+            return set()
+
+    async def _get_lsh_index(self) -> MinHashLSH:
+        """Load persisted job signatures into the in-memory LSH index (once per engine)."""
+        if self._lsh is not None and self._lsh_engine is database.engine:
+            return self._lsh
+
+        lsh = MinHashLSH()
+        try:
+            async with get_async_session() as session:
+                result = await session.execute(select(JobSignature.url_hash, JobSignature.signature))
+                for url_hash, blob in result.fetchall():
+                    lsh.insert(url_hash, np.frombuffer(blob, dtype=np.uint32))
+            logger.info(f"Loaded {len(lsh)} job signatures into LSH index")
+        except Exception as e:
+            # Serve the empty index for this call only; a later call retries the load
+            logger.error(f"Error loading job signatures: {e}")
+            return lsh
+
+        self._lsh = lsh
+        self._lsh_engine = database.engine
+        return lsh
+
+    def _split_near_duplicates(
+        self,
+        jobs: List[Dict[str, Any]],
+        lsh: MinHashLSH
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """Drop jobs that near-duplicate a processed job or an earlier job in the same batch."""
+        batch_lsh = MinHashLSH(lsh.bands, lsh.rows, lsh.threshold)
+        survivors = []
+        duplicate_count = 0
+
+        for job, signature in zip(jobs, compute_signatures(jobs)):
+            if signature is not None:
+                if lsh.query(signature) or batch_lsh.query(signature):
+                    duplicate_count += 1
+                    logger.debug(f"Skipping near-duplicate job: {job.get('title')} at {job.get('company')}")
+                    continue
+                batch_lsh.insert(_url_hash(job.get("url") or str(id(job))), signature)
+            survivors.append(job)
+
+        return survivors, duplicate_count
+
     async def get_processed_urls(self) -> Set[str]:
         """
         Get all processed job URLs from the database.
         
+        This reads the whole table; to check a batch of jobs use
+        ``lookup_processed_urls`` and to size it ``get_processed_urls_count``.
+        
         Returns:
             Set of URLs that have been processed
         """
@@ -41,6 +217,51 @@ class JobDeduplicationService:
             logger.error(f"Error retrieving processed URLs: {e}")
             return set()
     
+    async def get_processed_urls_count(self) -> int:
+        """Number of processed job URLs, counted in the database."""
+        try:
+            async with get_async_session() as session:
+                result = await session.execute(select(func.count()).select_from(ProcessedJobUrl))
+                return int(result.scalar_one())
+        except Exception as e:
+            logger.error(f"Error counting processed URLs: {e}")
+            return 0
+    
+    @staticmethod
+    def _processed_url_rows(jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Rows for the processed URLs table, one per job with a URL."""
+        records = []
+        for job in jobs:
+            url = job.get("url")
+            if url:
+                records.append({
+                    "url": url,
+                    "job_title": job.get("title", "")[:100],  # Limit length
+                    "company": job.get("company", "")[:100]   # Limit length
+                })
+        return records
+
+    def _signature_rows(self, jobs: List[Dict[str, Any]], lsh: MinHashLSH) -> List[Tuple[Dict[str, Any], np.ndarray]]:
+        """(row, signature) pairs for jobs not yet in the LSH index, deduplicated by URL."""
+        rows = []
+        seen: Set[str] = set()
+        for job, signature in zip(jobs, compute_signatures(jobs)):
+            url = job.get("url")
+            if not url or signature is None:
+                continue
+            key = _url_hash(url)
+            if key in lsh or key in seen:
+                continue
+            seen.add(key)
+            rows.append(({"url_hash": key, "url": url, "signature": signature.tobytes()}, signature))
+        return rows
+
+    @staticmethod
+    def _remember_signatures(signature_rows: List[Tuple[Dict[str, Any], np.ndarray]], lsh: MinHashLSH) -> None:
+        """Mirror committed signature rows into the in-memory LSH index."""
+        for row, signature in signature_rows:
+            lsh.insert(row["url_hash"], signature)
+
     async def add_processed_urls(self, jobs: List[Dict[str, Any]]) -> None:
         """
         Add job URLs to the processed URLs table.
@@ -54,15 +275,7 @@ class JobDeduplicationService:
         try:
             async with get_async_session() as session:
                 # Prepare records for bulk insert
-                records = []
-                for job in jobs:
-                    url = job.get("url")
-                    if url:
-                        records.append({
-                            "url": url,
-                            "job_title": job.get("title", "")[:100],  # Limit length
-                            "company": job.get("company", "")[:100]   # Limit length
-                        })
+                records = self._processed_url_rows(jobs)
                 
                 if records:
                     # Use SQLite's INSERT OR IGNORE to handle duplicates gracefully
@@ -124,11 +337,22 @@ class JobDeduplicationService:
         
         logger.info(f"🔍 Starting deduplication check for {len(jobs)} jobs")
         
-        # Get already processed URLs
-        processed_urls = await self.get_processed_urls()
+        # Drop near-duplicates via LSH band lookups before touching the URL table
+        lsh = await self._get_lsh_index()
+        candidates, near_duplicates = self._split_near_duplicates(jobs, lsh)
+        if near_duplicates:
+            logger.info(f"🔄 Filtered out {near_duplicates} near-duplicate jobs")
+        
+        if not candidates:
+            logger.info("⚠️ All jobs were duplicates, nothing new to process")
+            return candidates
+        
+        # Only this batch's URLs are looked up, with a single IN query
+        urls = list({job["url"] for job in candidates if job.get("url")})
+        processed_urls = await self.lookup_processed_urls(urls)
         
         # Filter out duplicates
-        new_jobs = self.filter_new_jobs(jobs, processed_urls)
+        new_jobs = self.filter_new_jobs(candidates, processed_urls)
         
         if new_jobs:
             logger.info(f"📝 Will process {len(new_jobs)} new jobs (filtered {len(jobs) - len(new_jobs)} duplicates)")
@@ -141,11 +365,37 @@ class JobDeduplicationService:
         """
         Mark jobs as processed after successful AI analysis and Airtable storage.
         
+        URLs and MinHash signatures are written in one transaction: one
+        executemany ``INSERT ... ON CONFLICT DO NOTHING`` per table and a
+        single commit.
+        
         Args:
             jobs: List of job dictionaries that have been successfully processed
         """
-        await self.add_processed_urls(jobs)
-        logger.info(f"✅ Marked {len(jobs)} jobs as processed")
+        if not jobs:
+            return
+        
+        try:
+            lsh = await self._get_lsh_index()
+            url_rows = self._processed_url_rows(jobs)
+            signature_rows = self._signature_rows(jobs, lsh)
+            if not url_rows and not signature_rows:
+                logger.warning("No valid URLs found in jobs to add")
+                return
+            
+            async with get_async_session() as session:
+                if url_rows:
+                    stmt = insert(ProcessedJobUrl).on_conflict_do_nothing(index_elements=["url"])
+                    await session.execute(stmt, url_rows)
+                if signature_rows:
+                    stmt = insert(JobSignature).on_conflict_do_nothing(index_elements=["url_hash"])
+                    await session.execute(stmt, [row for row, _ in signature_rows])
+                await session.commit()
+            
+            self._remember_signatures(signature_rows, lsh)
+            logger.info(f"✅ Marked {len(jobs)} jobs as processed")
+        except Exception as e:
+            logger.error(f"Error marking jobs as processed: {e}")
 
 
 # Global instance for use across the application
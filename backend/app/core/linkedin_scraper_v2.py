@@ -9,6 +9,7 @@ Reference: https://github.com/luminati-io/bright-data-scraping-browser-nodejs-pu
 """
 
 import asyncio
+import functools
 import json
 import subprocess
 import tempfile
@@ -23,6 +24,9 @@ from app.core.config import settings
 
 logger = structlog.get_logger()
 
+_WHITESPACE_RE = re.compile(r'\s+')
+_NUMBER_RE = re.compile(r'\d+')
+
 
 class LinkedInScraperV2:
     """
@@ -33,6 +37,20 @@ class LinkedInScraperV2:
     execution through subprocess calls.
     """
     
+    # Job page description containers, most specific first. Serialised once
+    # so every generated script embeds the same literal.
+    _DESCRIPTION_SELECTORS = (
+        '.description__text',
+        '.show-more-less-html__markup',
+        '.jobs-box__html-content',
+        '.jobs-description__content',
+        '.jobs-description',
+        '.job-description',
+        '[data-testid="job-description"]',
+    )
+    _DESCRIPTION_SELECTORS_JS = json.dumps(list(_DESCRIPTION_SELECTORS))
+    _DESCRIPTION_WAIT_SELECTOR_JS = json.dumps(', '.join(_DESCRIPTION_SELECTORS[:4]))
+    
     def __init__(self):
         self.websocket_endpoint = self._build_websocket_endpoint()
         self.rate_limit_delay = 2.0
@@ -172,8 +190,19 @@ class LinkedInScraperV2:
             return jobs
         
         logger.info(f"Enhancing {len(jobs)} jobs with full descriptions")
-        enhanced_jobs = []
         
+        # Fetch every description over a single browser connection instead of
+        # spawning Node.js and reconnecting once per job
+        job_urls = [job.get('url', '') for job in jobs if job.get('url')]
+        descriptions: Dict[str, str] = {}
+        if job_urls:
+            try:
+                await self._rate_limit()
+                descriptions = await self._scrape_job_descriptions(job_urls)
+            except Exception as e:
+                logger.error(f"❌ Failed to fetch full descriptions: {e}")
+        
+        enhanced_jobs = []
         for i, job in enumerate(jobs, 1):
             job_url = job.get('url', '')
             if not job_url:
@@ -181,27 +210,14 @@ class LinkedInScraperV2:
                 enhanced_jobs.append(job)
                 continue
             
-            logger.info(f"Fetching full description for job {i}/{len(jobs)}: {job.get('title', 'Unknown')}")
-            logger.info(f"Job URL: {job_url}")
-            
-            try:
-                # Rate limiting between requests
-                await self._rate_limit()
-                
-                # Get full description from job page
-                full_description = await self._scrape_job_description(job_url)
-                
-                if full_description and len(full_description.strip()) > 50:
-                    job['description'] = full_description
-                    job['description_source'] = 'full_page'
-                    logger.info(f"✅ Enhanced job with full description ({len(full_description)} chars)")
-                else:
-                    job['description_source'] = 'search_page'
-                    logger.warning(f"⚠️ Could not get substantial full description for job {i} (got {len(full_description) if full_description else 0} chars)")
-                
-            except Exception as e:
-                logger.error(f"❌ Failed to enhance job {i} with full description: {e}")
+            full_description = descriptions.get(job_url)
+            if full_description and len(full_description.strip()) > 50:
+                job['description'] = full_description
+                job['description_source'] = 'full_page'
+                logger.info(f"✅ Enhanced job {i}/{len(jobs)} with full description ({len(full_description)} chars)")
+            else:
                 job['description_source'] = 'search_page'
+                logger.warning(f"⚠️ Could not get substantial full description for job {i} (got {len(full_description) if full_description else 0} chars)")
             
             enhanced_jobs.append(job)
         
@@ -211,61 +227,66 @@ class LinkedInScraperV2:
         """
         Scrape the full job description from a LinkedIn job page.
         """
+        descriptions = await self._scrape_job_descriptions([job_url])
+        return descriptions.get(job_url)
+    
+    async def _scrape_job_descriptions(self, job_urls: List[str]) -> Dict[str, str]:
+        """
+        Scrape full job descriptions for several LinkedIn job pages in one browser session.
+        
+        Returns a mapping of job URL to description; pages without a substantial
+        description are omitted.
+        """
         try:
-            logger.info(f"🔍 Generating Puppeteer script for: {job_url}")
-            script_content = self._generate_job_description_script(job_url)
+            logger.info(f"🔍 Generating Puppeteer script for {len(job_urls)} job pages")
+            script_content = self._generate_job_description_script(job_urls)
             
             logger.info(f"🚀 Executing Puppeteer script...")
             result = await self._execute_nodejs_script(script_content)
             
-            if result and len(result) > 0:
-                if 'description' in result[0]:
-                    description = result[0]['description']
-                    if description and len(description.strip()) > 50:
-                        logger.info(f"✅ Successfully scraped description ({len(description)} chars)")
-                        return description
-                    else:
-                        logger.warning(f"⚠️ Description too short: {len(description) if description else 0} chars")
-                        return None
-                else:
-                    logger.warning(f"⚠️ No 'description' field in result: {list(result[0].keys()) if result[0] else 'empty result'}")
-                    return None
-            else:
+            if not result:
                 logger.warning(f"⚠️ Empty or no result from Puppeteer script")
-                return None
+                return {}
+            
+            descriptions = {}
+            for item in result:
+                description = item.get('description') if isinstance(item, dict) else None
+                if description and len(description.strip()) > 50:
+                    descriptions[item.get('url', '')] = description
+                else:
+                    logger.warning(f"⚠️ Description too short for {item.get('url') if isinstance(item, dict) else item}: {len(description) if description else 0} chars")
+            
+            logger.info(f"✅ Successfully scraped {len(descriptions)}/{len(job_urls)} descriptions")
+            return descriptions
             
         except Exception as e:
-            logger.error(f"❌ Error scraping job description from {job_url}: {e}")
-            return None
+            logger.error(f"❌ Error scraping job descriptions: {e}")
+            return {}
     
-    def _generate_job_description_script(self, job_url: str) -> str:
+    def _generate_job_description_script(self, job_urls: List[str]) -> str:
         """
-        Generate a Puppeteer script to scrape job description from individual job page.
+        Generate a Puppeteer script that scrapes job descriptions from individual job pages.
+        
+        The script connects to the browser once and opens a fresh page per URL,
+        pausing ``rate_limit_delay`` seconds between navigations.
         """
         return f"""
 const puppeteer = require('puppeteer-core');
 
-async function scrapeJobDescription() {{
-    console.error('🚀 Starting job description scraper for: {job_url}');
-    
-    let browser;
+const jobUrls = {json.dumps(list(job_urls))};
+const descriptionSelectors = {self._DESCRIPTION_SELECTORS_JS};
+const delayMs = {int(self.rate_limit_delay * 1000)};
+
+async function scrapeJobDescription(browser, jobUrl) {{
+    // Create a new page
+    const page = await browser.newPage();
     try {{
-        // Connect to Bright Data's Scraping Browser
-        console.error('🌐 Connecting to Bright Data Scraping Browser...');
-        browser = await puppeteer.connect({{
-            browserWSEndpoint: '{self.websocket_endpoint}'
-        }});
-        console.error('✅ Connected to browser');
-        
-        // Create a new page
-        const page = await browser.newPage();
-        
         // Set a realistic user agent
         await page.setUserAgent('Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36');
         
         // Navigate to job page
-        console.error('🌐 Navigating to job page...');
-        await page.goto('{job_url}', {{ 
+        console.error(`🌐 Navigating to job page: ${{jobUrl}}`);
+        await page.goto(jobUrl, {{ 
             waitUntil: 'networkidle2', 
             timeout: 60000 
         }});
@@ -274,7 +295,7 @@ async function scrapeJobDescription() {{
         // Wait for job description to appear
         console.error('⏳ Waiting for job description...');
         try {{
-            await page.waitForSelector('.description__text, .show-more-less-html__markup, .jobs-box__html-content, .jobs-description__content', {{ 
+            await page.waitForSelector({self._DESCRIPTION_WAIT_SELECTOR_JS}, {{ 
                 timeout: 30000 
             }});
             console.error('✅ Job description found');
@@ -284,19 +305,9 @@ async function scrapeJobDescription() {{
         
         // Extract job description
         console.error('📊 Extracting job description...');
-        const description = await page.evaluate(() => {{
+        const description = await page.evaluate((selectors) => {{
             // Try multiple selectors for job description
-            const descriptionSelectors = [
-                '.description__text',
-                '.show-more-less-html__markup',
-                '.jobs-box__html-content', 
-                '.jobs-description__content',
-                '.jobs-description',
-                '.job-description',
-                '[data-testid="job-description"]'
-            ];
-            
-            for (const selector of descriptionSelectors) {{
+            for (const selector of selectors) {{
                 const element = document.querySelector(selector);
                 if (element) {{
                     // Get text content and clean it up
@@ -306,31 +317,55 @@ async function scrapeJobDescription() {{
                     text = text.replace(/\\s+/g, ' ').trim();
                     
                     if (text.length > 100) {{ // Make sure we got substantial content
-                        console.log(`Found description with selector: ${{selector}} (${{text.length}} chars)`);
                         return text;
                     }}
                 }}
             }}
             
-            console.log('No substantial job description found');
             return '';
-        }});
+        }}, descriptionSelectors);
         
         console.error(`✅ Extracted description (${{description.length}} characters)`);
         
-        // Output the result as JSON
-        const result = [{{
-            url: '{job_url}',
+        return {{
+            url: jobUrl,
             description: description,
             scraped_at: new Date().toISOString()
-        }}];
+        }};
+    }} finally {{
+        await page.close();
+    }}
+}}
+
+async function scrapeJobDescriptions() {{
+    console.error(`🚀 Starting job description scraper for ${{jobUrls.length}} jobs`);
+    
+    const results = [];
+    let browser;
+    try {{
+        // Connect to Bright Data's Scraping Browser
+        console.error('🌐 Connecting to Bright Data Scraping Browser...');
+        browser = await puppeteer.connect({{
+            browserWSEndpoint: '{self.websocket_endpoint}'
+        }});
+        console.error('✅ Connected to browser');
         
-        console.log(JSON.stringify(result));
+        for (let i = 0; i < jobUrls.length; i++) {{
+            if (i > 0) {{
+                await new Promise(resolve => setTimeout(resolve, delayMs));
+            }}
+            try {{
+                results.push(await scrapeJobDescription(browser, jobUrls[i]));
+            }} catch (error) {{
+                console.error(`❌ Error scraping ${{jobUrls[i]}}:`, error.message);
+            }}
+        }}
         
     }} catch (error) {{
         console.error('❌ Error occurred:', error.message);
-        console.log(JSON.stringify([])); // Return empty array on error
     }} finally {{
+        // Output the results as JSON (empty array on connection failure)
+        console.log(JSON.stringify(results));
         if (browser) {{
             await browser.close();
             console.error('👋 Browser closed');
@@ -339,7 +374,7 @@ async function scrapeJobDescription() {{
 }}
 
 // Run the scraper
-scrapeJobDescription();
+scrapeJobDescriptions();
 """
 
     def _generate_puppeteer_script(self, search_url: str, limit: int) -> str:
@@ -575,15 +610,16 @@ async function scrapeLinkedIn() {{
 scrapeLinkedIn();
 """
 
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
     def _build_linkedin_search_url(
-        self, 
         keywords: str, 
         location: str, 
         experience_level: str, 
         job_type: str, 
         date_posted: str
     ) -> str:
-        """Build LinkedIn job search URL with proper filters."""
+        """Build LinkedIn job search URL with proper filters; memoized per filter tuple."""
         base_url = "https://www.linkedin.com/jobs/search"
         params = {
             "keywords": keywords,
@@ -673,7 +709,7 @@ scrapeLinkedIn();
         """Clean and normalize text content."""
         if not text:
             return None
-        return re.sub(r'\s+', ' ', str(text).strip())
+        return _WHITESPACE_RE.sub(' ', str(text).strip())
 
     def _parse_date(self, date_str: Optional[str]) -> Optional[str]:
         """Parse relative dates like '2 days ago' into ISO format."""
@@ -685,16 +721,16 @@ scrapeLinkedIn();
             now = datetime.now()
             
             if "hour" in date_str:
-                hours = int(re.search(r'\d+', date_str).group())
+                hours = int(_NUMBER_RE.search(date_str).group())
                 return (now - timedelta(hours=hours)).isoformat()
             elif "day" in date_str:
-                days = int(re.search(r'\d+', date_str).group())
+                days = int(_NUMBER_RE.search(date_str).group())
                 return (now - timedelta(days=days)).isoformat()
             elif "week" in date_str:
-                weeks = int(re.search(r'\d+', date_str).group())
+                weeks = int(_NUMBER_RE.search(date_str).group())
                 return (now - timedelta(weeks=weeks)).isoformat()
             elif "month" in date_str:
-                months = int(re.search(r'\d+', date_str).group())
+                months = int(_NUMBER_RE.search(date_str).group())
                 return (now - timedelta(days=months * 30)).isoformat()
                 
         except Exception as e:
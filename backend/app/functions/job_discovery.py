@@ -247,6 +247,7 @@ class Pipeline:
         """
         start_time = datetime.now().timestamp()
         scraper = None
+        gemini_client = None
         logger = self.logger.bind(
             function="job_discovery",
             query=search_params.get("query", ""),
@@ -258,20 +259,20 @@ class Pipeline:
             from ..core.airtable_client import AirtableClient
             from ..core.job_deduplication import JobDeduplicationService
             from ..core.gemini_client import GeminiClient
+            from ..core import database
             from ..core.database import init_db
+            from ..core.config import settings
             
-            # Initialize database for deduplication
-            await init_db()
+            # Initialize database for deduplication once; re-initialising would
+            # dispose the pool every request
+            if database.engine is None:
+                await init_db()
             
             # Initialize services
             scraper = LinkedInScraperV2()
             dedup_service = JobDeduplicationService()
             gemini_client = GeminiClient()
             
-            # Get already processed URLs for deduplication
-            logger.info("Checking for duplicate job URLs")
-            processed_urls = await dedup_service.get_processed_urls()
-            
             # Perform job search
             logger.info("Starting LinkedIn job search", search_params=search_params)
             raw_jobs = await scraper.search_jobs(
@@ -287,7 +288,11 @@ class Pipeline:
                 logger.warning("No jobs found from LinkedIn search")
                 return []
             
-            # Filter out duplicate URLs
+            # Filter out duplicate URLs, looking up only this search's URLs
+            logger.info("Checking for duplicate job URLs")
+            processed_urls = await dedup_service.lookup_processed_urls(
+                list({job['url'] for job in raw_jobs if job.get('url')})
+            )
             new_jobs = []
             for job in raw_jobs:
                 job_url = job.get('url', '')
@@ -298,9 +303,16 @@ class Pipeline:
             
             logger.info(f"After deduplication: {len(new_jobs)} new jobs out of {len(raw_jobs)} total")
             
-            # Analyze jobs against CV for relevance
-            analyzed_jobs = []
-            for i, job in enumerate(new_jobs, 1):
+            # Analyze jobs against CV for relevance, running the Gemini calls
+            # concurrently under a cap to stay within provider quotas
+            min_relevance = search_params.get('min_relevance_score', 0.6)
+            semaphore = asyncio.Semaphore(max(1, settings.GEMINI_MAX_CONCURRENCY))
+            
+            async def _analyze_one(i: int, job: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+                async with semaphore:
+                    return await _analyze(i, job)
+            
+            async def _analyze(i: int, job: Dict[str, Any]) -> Optional[Dict[str, Any]]:
                 job_title = job.get('title', 'Unknown Position')
                 company = job.get('company', 'Unknown Company')
                 description = job.get('description', '')
@@ -325,10 +337,9 @@ class Pipeline:
                         job['cv_analyzed'] = True
                         
                         # Only include jobs with decent relevance (>= 0.6 by default)
-                        min_relevance = search_params.get('min_relevance_score', 0.6)
                         if relevance_score >= min_relevance:
-                            analyzed_jobs.append(job)
                             logger.info(f"✅ Included job (relevance: {relevance_score:.2f}): {job_title}")
+                            return job
                         else:
                             logger.info(f"❌ Excluded job (relevance: {relevance_score:.2f}): {job_title} - {match_reasoning}")
                     else:
@@ -336,8 +347,8 @@ class Pipeline:
                         job['relevance_score'] = 0.5
                         job['match_reasoning'] = 'Analysis failed, included for review'
                         job['cv_analyzed'] = False
-                        analyzed_jobs.append(job)
                         logger.warning(f"⚠️ Analysis failed for {job_title}, including anyway")
+                        return job
                         
                 except Exception as e:
                     logger.error(f"Error analyzing job {job_title}: {e}")
@@ -345,7 +356,13 @@ class Pipeline:
                     job['relevance_score'] = 0.3
                     job['match_reasoning'] = f'Analysis error: {str(e)}'
                     job['cv_analyzed'] = False
-                    analyzed_jobs.append(job)
+                    return job
+                return None
+            
+            results = await asyncio.gather(
+                *[_analyze_one(i, job) for i, job in enumerate(new_jobs, 1)]
+            )
+            analyzed_jobs = [job for job in results if job is not None]
             
             logger.info(f"After CV analysis: {len(analyzed_jobs)} suitable jobs")
             
@@ -356,7 +373,7 @@ class Pipeline:
                     await airtable_client.add_jobs(analyzed_jobs)
                     logger.info(f"Stored {len(analyzed_jobs)} jobs in Airtable")
                     
-                    # Mark URLs as processed
+                    # Mark URLs as processed only once the jobs are stored
                     await dedup_service.add_processed_urls(analyzed_jobs)
                     logger.info(f"Marked {len(analyzed_jobs)} job URLs as processed")
                     
@@ -376,6 +393,11 @@ class Pipeline:
                     await scraper.close()
                 except:
                     pass
+            if gemini_client:
+                try:
+                    await gemini_client.close()
+                except:
+                    pass
 
     def _format_job_response(self, jobs: List[Dict[str, Any]]) -> str:
         """
@@ -26,6 +26,7 @@ from app.core.config import settings
 from app.api.smart_assistant import router as smart_assistant_router
 from app.core.database import init_db, close_db
 from app.core.graphrag_service import graphrag_service
+from app.core.gemini_client import gemini_client
 
 # Setup logging
 logger = logging.getLogger("smart_assistant")
@@ -57,6 +58,10 @@ async def lifespan(app: FastAPI):
         await close_db()
     except Exception as e:
         logger.error(f"Failed to close database: {e}")
+    try:
+        await gemini_client.close()
+    except Exception as e:
+        logger.error(f"Failed to close Gemini client session: {e}")
 
 # Create FastAPI application
 app = FastAPI(
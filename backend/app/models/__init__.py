@@ -6,6 +6,8 @@ from .database import (
 	EmailProcessingHistory,
 	IntelligenceBriefing,
 	ProcessedJobUrl,
+	JobSignature,
+	LLMCacheEntry,
 	GraphNode,
 	GraphEdge,
 )
@@ -18,6 +20,8 @@ __all__ = [
 	"EmailProcessingHistory",
 	"IntelligenceBriefing",
 	"ProcessedJobUrl",
+	"JobSignature",
+	"LLMCacheEntry",
 	"GraphNode",
 	"GraphEdge",
 ]
@@ -8,7 +8,7 @@ Provides SQLAlchemy ORM models for:
 - Intelligence briefing cache and history
 """
 from typing import Optional, Dict, Any, List
-from sqlalchemy import Column, String, Text, Integer, Boolean, JSON, DateTime, Float, ForeignKey, Table
+from sqlalchemy import Column, String, Text, Integer, Boolean, JSON, DateTime, Float, ForeignKey, Table, LargeBinary
 from sqlalchemy.ext.mutable import MutableDict
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
@@ -152,6 +152,30 @@ class ProcessedJobUrl(Base, TimestampMixin):
     def __repr__(self):
         return f"<ProcessedJobUrl(url='{self.url}', title='{self.job_title}')>"
 
+# MinHash signatures of processed jobs, used to catch near-duplicate postings
+# (the same job cross-posted under different URLs)
+class JobSignature(Base, TimestampMixin):
+    __tablename__ = "job_signatures"
+
+    url_hash = Column(String, primary_key=True, index=True)  # sha1 of the job URL
+    url = Column(String, nullable=False)
+    signature = Column(LargeBinary, nullable=False)  # packed uint32 MinHash values
+
+    def __repr__(self):
+        return f"<JobSignature(url='{self.url}')>"
+
+# Successful Gemini responses keyed by a hash of model + prompt, so reruns over
+# the same jobs replay instead of calling the API again
+class LLMCacheEntry(Base, TimestampMixin):
+    __tablename__ = "llm_cache"
+
+    hash = Column(String, primary_key=True, index=True)  # sha256 of kind, model and prompt
+    kind = Column(String, index=True, nullable=False)    # e.g. analyze_job_posting
+    payload = Column(JSON, nullable=False)
+
+    def __repr__(self):
+        return f"<LLMCacheEntry(kind='{self.kind}', hash='{self.hash[:12]}')>"
+
 # --- GraphRAG models (SQLite fallback) ---
 class GraphNode(Base, TimestampMixin):
     __tablename__ = "graphrag_nodes"
@@ -165,6 +189,8 @@ class GraphNode(Base, TimestampMixin):
     embedding = Column(JSON, nullable=True)   # optional: store local embedding vector
     # Phase 3: explicit namespace column (denormalized copy for fast filtering)
     namespace = Column(String, index=True, nullable=True)
+    # Outgoing edges; read-only so node deletes never touch edge rows
+    edges = relationship("GraphEdge", foreign_keys="[GraphEdge.source_id]", viewonly=True)
 
 class GraphEdge(Base, TimestampMixin):
     __tablename__ = "graphrag_edges"
@@ -3,64 +3,95 @@
 Debug script to test the LinkedIn scraper and see what's happening
 """
 import asyncio
+import logging
+import logging.handlers
 import sys
 import os
+import time
 
 # Add the app directory to Python path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'app'))
 
 from app.core.linkedin_scraper_v2 import LinkedInScraperV2
 
+log = logging.getLogger(__name__)
+
+
+def _install_buffered_logging() -> logging.handlers.MemoryHandler:
+    """Buffer console output and flush it in batches rather than once per line."""
+    stream = logging.StreamHandler(sys.stdout)
+    stream.setFormatter(logging.Formatter("%(message)s"))
+    buffered = logging.handlers.MemoryHandler(capacity=1000, flushLevel=logging.ERROR, target=stream)
+    log.addHandler(buffered)
+    log.setLevel(logging.INFO)
+    log.propagate = False
+    return buffered
+
+
 async def test_scraper():
-    print("🧪 Testing LinkedIn Scraper Debug")
-    print("=" * 50)
+    buffered = _install_buffered_logging()
+    log.info("🧪 Testing LinkedIn Scraper Debug")
+    log.info("=" * 50)
     
     scraper = LinkedInScraperV2()
     
-    # Test with a simple search
-    keywords = "python developer"
+    # Run several searches on one scraper instance
+    keyword_variants = ["python developer", "backend engineer", "data engineer"]
     location = "remote"
     
-    print(f"🔍 Testing search: '{keywords}' in '{location}'")
-    print(f"🌐 Bright Data endpoint configured: {scraper.websocket_endpoint is not None}")
+    log.info("🔍 Testing searches: %s in '%s'", keyword_variants, location)
+    log.info("🌐 Bright Data endpoint configured: %s", scraper.websocket_endpoint is not None)
     
     if scraper.websocket_endpoint:
-        print(f"📡 Endpoint: {scraper.websocket_endpoint[:50]}..." if len(scraper.websocket_endpoint) > 50 else scraper.websocket_endpoint)
+        if len(scraper.websocket_endpoint) > 50:
+            log.info("📡 Endpoint: %s...", scraper.websocket_endpoint[:50])
+        else:
+            log.info("%s", scraper.websocket_endpoint)
     else:
-        print("❌ No Bright Data endpoint configured!")
+        log.info("❌ No Bright Data endpoint configured!")
+        buffered.flush()
         return
     
     try:
-        print("\n🚀 Starting search...")
-        jobs = await scraper.search_jobs(
-            keywords=keywords,
-            location=location,
-            limit=3
-        )
-        
-        print(f"\n✅ Search completed!")
-        print(f"📊 Found {len(jobs)} jobs")
+        total_start = time.perf_counter()
+        for keywords in keyword_variants:
+            log.info("\n🚀 Starting search: '%s'...", keywords)
+            start = time.perf_counter()
+            jobs = await scraper.search_jobs(
+                keywords=keywords,
+                location=location,
+                limit=3
+            )
+            
+            log.info("\n✅ Search completed in %.1fs!", time.perf_counter() - start)
+            log.info("📊 Found %d jobs", len(jobs))
+            
+            if jobs:
+                log.info("\n📋 Jobs found:")
+                for i, job in enumerate(jobs, 1):
+                    log.info("  %d. %s at %s", i, job.get('title', 'No title'), job.get('company', 'No company'))
+                    log.info("     📍 %s", job.get('location', 'No location'))
+                    log.info("     🔗 %s", job.get('url', 'No URL'))
+                    log.info("")
+            else:
+                log.info("\n❌ No jobs found - this indicates a scraping issue")
         
-        if jobs:
-            print("\n📋 Jobs found:")
-            for i, job in enumerate(jobs, 1):
-                print(f"  {i}. {job.get('title', 'No title')} at {job.get('company', 'No company')}")
-                print(f"     📍 {job.get('location', 'No location')}")
-                print(f"     🔗 {job.get('url', 'No URL')}")
-                print()
-        else:
-            print("\n❌ No jobs found - this indicates a scraping issue")
+        log.info("\n⏱️ Total time for %d searches: %.1fs", len(keyword_variants), time.perf_counter() - total_start)
             
     except Exception as e:
-        print(f"\n❌ Error occurred: {e}")
-        import traceback
-        traceback.print_exc()
+        log.exception("\n❌ Error occurred: %s", e)
     
     finally:
         try:
             await scraper.close()
         except:
             pass
+        buffered.flush()
 
 if __name__ == "__main__":
+    try:  # libuv-backed event loop when available
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
     asyncio.run(test_scraper())
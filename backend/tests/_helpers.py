@@ -0,0 +1,16 @@
+"""Shared helpers for the script-style test harnesses in this directory."""
+import contextlib
+import io
+import sys
+
+
+@contextlib.contextmanager
+def buffered_stdout():
+    """Collect prints in memory and hand them to stdout in a single write"""
+    buf = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(buf):
+            yield
+    finally:
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
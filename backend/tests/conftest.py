@@ -0,0 +1,133 @@
+"""
+Shared fixtures for the backend test suite.
+
+``db_session`` runs a test against a session-wide in-memory SQLite database:
+the application's session factory is bound to a single connection inside an
+outer transaction, ``commit()`` calls made by app code only flush into that
+transaction, and it is rolled back when the test finishes. Commits are not
+mapped to SAVEPOINTs because concurrent requests would interleave them on the
+shared connection.
+
+The application's configured database is initialised once per session, and
+``client`` is one in-process ``AsyncClient`` shared by every test. Background
+tasks the app fires (e.g. cluster recompute after ingest) are awaited before a
+test's loop closes, so none is abandoned holding a SQLite write lock.
+
+Under pytest-xdist (``make unit-tests``) each worker gets its own SQLite file,
+derived from ``DATABASE_URL`` with the worker id appended. Tests are grouped
+per file for ``--dist loadgroup``; files marked ``xdist_group`` (the index
+runs sharing ``graphrag_artifacts/.graphrag_index.lock``) share one worker.
+
+Async tests run on uvloop when it is installed.
+"""
+import asyncio
+import os
+
+import pytest
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.core import database
+from app.core.config import settings
+from app.main import app
+from app.models.database import Base
+
+try:  # Optional uvloop event loop for the async tests
+    import uvloop
+except ImportError:  # pragma: no cover
+    uvloop = None
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "xdist_group(name): run on the same pytest-xdist worker as the rest of the group")
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config, items):
+    # Ungrouped tests stay together per file, as --dist loadfile would keep them
+    for item in items:
+        if item.get_closest_marker("xdist_group") is None:
+            item.add_marker(pytest.mark.xdist_group(item.module.__name__))
+
+
+async def _drain_background_tasks(timeout: float = 10.0) -> None:
+    current = asyncio.current_task()
+    pending = [t for t in asyncio.all_tasks() if t is not current and not t.done()]
+    if pending:
+        await asyncio.wait(pending, timeout=timeout)
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    if uvloop is not None:
+        return uvloop.EventLoopPolicy()
+    return asyncio.DefaultEventLoopPolicy()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def async_engine():
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def db_session(async_engine):
+    async with async_engine.connect() as connection:
+        transaction = await connection.begin()
+        previous = (database.engine, database.async_session)
+        database.engine = async_engine
+        database.async_session = async_sessionmaker(
+            bind=connection,
+            class_=AsyncSession,
+            expire_on_commit=False,
+            autoflush=False,
+            join_transaction_mode="rollback_only",
+        )
+        try:
+            async with database.async_session() as session:
+                yield session
+            await _drain_background_tasks()
+        finally:
+            database.engine, database.async_session = previous
+            await transaction.rollback()
+
+
+def _worker_database_url(url: str, worker: str) -> str:
+    """Per-worker variant of a file-backed SQLite URL; other URLs are returned unchanged."""
+    if not url.startswith("sqlite") or ":memory:" in url:
+        return url
+    root, ext = os.path.splitext(url)
+    return f"{root}_{worker}{ext or '.db'}"
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session", autouse=True)
+async def _init_db_once():
+    previous_url = settings.DATABASE_URL
+    worker = os.getenv("PYTEST_XDIST_WORKER")
+    if worker:
+        settings.DATABASE_URL = _worker_database_url(previous_url, worker)
+    await database.init_db()
+    yield
+    await database.close_db()
+    settings.DATABASE_URL = previous_url
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def client():
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        yield ac
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def _await_background_tasks():
+    yield
+    await _drain_background_tasks()
@@ -0,0 +1,31 @@
+import pytest
+
+from app.core.airtable_client import AirtableClient, AIRTABLE_BATCH_SIZE
+
+pytestmark = pytest.mark.asyncio
+
+
+class _FakeTable:
+    def __init__(self):
+        self.calls = []
+
+    def batch_create(self, records):
+        self.calls.append(len(records))
+        return [{"id": f"rec{len(self.calls)}_{i}", "fields": r} for i, r in enumerate(records)]
+
+
+async def test_add_jobs_batches_records():
+    client = AirtableClient()
+    client.api = object()
+    client.table = _FakeTable()
+
+    jobs = [
+        {"title": f"Engineer {i}", "company": "Acme", "url": f"https://x/jobs/{i}", "description": "d" * 1200}
+        for i in range(25)
+    ]
+    result = await client.add_jobs(jobs)
+
+    assert result["success"] is True
+    assert result["count"] == 25
+    assert len(result["record_ids"]) == 25
+    assert sorted(client.table.calls) == [5, AIRTABLE_BATCH_SIZE, AIRTABLE_BATCH_SIZE]
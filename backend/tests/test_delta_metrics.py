@@ -1,8 +1,26 @@
+import asyncio
+import pytest
+import pytest_asyncio
+
 from scripts.run_graphrag_index import orchestrate
 
+# Index runs share graphrag_artifacts/.graphrag_index.lock; keep them on one xdist worker
+pytestmark = [pytest.mark.asyncio, pytest.mark.xdist_group("graphrag_index")]
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def dry_run_result():
+    # One IngestLog scan shared by every assertion in this module
+    return await asyncio.to_thread(orchestrate, namespace="public", force=False, dry_run=True)
 
-def test_delta_metrics_present():
-    res = orchestrate(namespace="public", force=False, dry_run=True)
+
+async def test_delta_metrics_present(dry_run_result):
+    res = dry_run_result
     assert 'stale_docs' in res
     assert 'total_docs' in res
     assert res['stale_docs'] <= res['total_docs']
+
+
+async def test_dry_run_reports_without_indexing(dry_run_result):
+    assert dry_run_result['status'] == 'DRY_RUN'
+    assert dry_run_result['dry_run'] is True
@@ -7,11 +7,8 @@ from scripts.run_graphrag_index import orchestrate
 from app.core.graphrag_query_adapter import query_adapter
 from app.core.graphrag_service import graphrag_service
 
-
-@pytest.fixture(scope="module", autouse=True)
-def init_db():
-    asyncio.run(db.init_db())
-    yield
+# Index runs share graphrag_artifacts/.graphrag_index.lock; keep them on one xdist worker
+pytestmark = pytest.mark.xdist_group("graphrag_index")
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,64 @@
+import json
+from contextlib import asynccontextmanager
+
+import pytest
+from sqlalchemy import select
+
+from app.core.gemini_client import GeminiClient
+from app.models.database import LLMCacheEntry
+
+pytestmark = pytest.mark.asyncio
+
+
+class _FakeResponse:
+    status = 200
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def json(self, loads=json.loads):
+        analysis = {"relevance_score": 0.8, "match_reasoning": "fits"}
+        return {"candidates": [{"content": {"parts": [{"text": json.dumps(analysis)}]}}]}
+
+
+class _FakeSession:
+    def __init__(self):
+        self.posts = 0
+
+    def post(self, *args, **kwargs):
+        self.posts += 1
+        return _FakeResponse()
+
+
+async def test_analyze_job_posting_replays_from_cache(db_session):
+    client = GeminiClient()
+    client.api_key = "test-key"
+    fake = _FakeSession()
+
+    @asynccontextmanager
+    async def _fake_client_session():
+        yield fake
+
+    client._client_session = _fake_client_session
+
+    first = await client.analyze_job_posting("Build Python services", cv_text="Python engineer")
+    second = await client.analyze_job_posting("Build Python services", cv_text="Python engineer")
+    assert first == second
+    assert first["analysis"]["relevance_score"] == 0.8
+    assert fake.posts == 1
+
+    # A fresh client (empty in-memory LRU) replays from the llm_cache table
+    replay = GeminiClient()
+    replay.api_key = "test-key"
+    replay._client_session = _fake_client_session
+    assert await replay.analyze_job_posting("Build Python services", cv_text="Python engineer") == first
+    assert fake.posts == 1
+
+    rows = (await db_session.execute(select(LLMCacheEntry))).scalars().all()
+    assert [r.kind for r in rows] == ["analyze_job_posting"]
+
+    await client.analyze_job_posting("Different role", cv_text="Python engineer")
+    assert fake.posts == 2
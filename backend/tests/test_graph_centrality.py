@@ -0,0 +1,18 @@
+import pytest
+from app.core.graphrag_service import graphrag_service
+from sqlalchemy import select
+from app.models.database import GraphNode
+
+pytestmark = pytest.mark.asyncio
+
+doc_text = """EXPERIENCE\nAcme Corp Senior Engineer working with Python Docker Kubernetes.\nResearch on Graph Algorithms and Network Optimization.\n"""
+
+async def test_centrality_computation(db_session):
+    r = await graphrag_service.ingest_document(doc_id='cent::1', text=doc_text, metadata={})
+    assert r.get('success')
+    c = await graphrag_service.compute_centrality()
+    assert c.get('success')
+    res = await db_session.execute(select(GraphNode))
+    nodes = res.scalars().all()
+    has_importance = any(((n.properties or {}).get('importance') is not None) for n in nodes)
+    assert has_importance, 'Expected some nodes to have importance after centrality compute'
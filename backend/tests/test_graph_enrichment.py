@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+from app.core.graphrag_service import graphrag_service
+
+pytestmark = pytest.mark.asyncio
+
+TEST_DOC = """EXPERIENCE\nAcme Corporation Lead Engineer built scalable Python microservices using Docker and Kubernetes.\nProjects included Graph Optimization and Transformer fine-tuning with PyTorch.\n"""
+
+async def _ingest():
+    r = await graphrag_service.ingest_document(doc_id="test::doc1", text=TEST_DOC, metadata={"source":"unit"})
+    assert r.get("success"), r
+    return r
+
+
+async def _fetch_nodes(session):
+    from sqlalchemy import select
+    from sqlalchemy.orm import selectinload
+    from app.models.database import GraphNode
+    stmt = select(GraphNode).options(selectinload(GraphNode.edges))
+    res = await session.execute(stmt)
+    return res.scalars().unique().all()
+
+async def test_enrichment_and_layout(db_session):
+    await _ingest()
+    nodes = await _fetch_nodes(db_session)
+    # One pass over the ORM rows into column arrays, then vectorized checks
+    def _row(n):
+        props = n.properties or {}
+        degree = props.get("degree")
+        x = (props.get("layout") or {}).get("x")
+        return (n.label or "", -1 if degree is None else degree, np.nan if x is None else x)
+
+    arr = np.array([_row(n) for n in nodes], dtype=[("label", "U32"), ("degree", "i4"), ("x", "f4")])
+    labels = set(np.unique(arr["label"]).tolist())
+    rels = set(np.unique(np.array([e.relation for n in nodes for e in n.edges], dtype=str)).tolist())
+    with_layout = arr[~np.isnan(arr["x"])]
+    deg_values = arr["degree"][arr["degree"] >= 0]
+    # Basic expectations: classification labels present
+    assert any(l in labels for l in ["Technology","Organization","Role"]) or "Entity" in labels
+    # Derived relations
+    assert "CO_OCCURS" in rels or "HAS_ENTITY" in rels
+    # Layout coordinates exist for at least some nodes
+    assert with_layout.size, "Expected at least one node with layout coordinates"
+    # Degree data persisted
+    assert deg_values.size, "Expected degree values persisted"
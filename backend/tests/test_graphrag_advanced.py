@@ -2,11 +2,9 @@ import pytest
 from httpx import AsyncClient, ASGITransport
 from uuid import uuid4
 from app.main import app
-from app.core.database import init_db
 
 @pytest.mark.asyncio
 async def test_namespace_isolation():
-    await init_db()
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as ac:
         doc_a = f"na-{uuid4()}"
@@ -32,7 +30,6 @@ async def test_namespace_isolation():
 
 @pytest.mark.asyncio
 async def test_metrics_and_path():
-    await init_db()
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as ac:
         # Ingest small doc to ensure nodes
@@ -1,32 +1,27 @@
 import pytest
 import asyncio
 import httpx
-from sqlalchemy import delete
-from app.core.database import init_db, get_db_session
+from sqlalchemy import insert
 from app.models.database import GraphNode, GraphEdge
 from app.main import app
 
 @pytest.mark.asyncio
-async def test_cluster_compute_and_summary():
-    await init_db()
-    # Seed small graph with two obvious clusters
-    async with get_db_session() as session:
-        await session.execute(delete(GraphEdge))
-        await session.execute(delete(GraphNode))
-        # Cluster A
-        for i in range(5):
-            session.add(GraphNode(id=f"a{i}", label="Entity", name=f"Alpha {i}", namespace="public", properties={"namespace":"public"}))
-        # Dense edges within A
-        for i in range(5):
-            for j in range(i+1,5):
-                session.add(GraphEdge(id=f"ea{i}{j}", source_id=f"a{i}", target_id=f"a{j}", relation="LINKS", confidence=0.9, properties={"namespace":"public"}))
-        # Cluster B
-        for i in range(5):
-            session.add(GraphNode(id=f"b{i}", label="Entity", name=f"Beta {i}", namespace="public", properties={"namespace":"public"}))
-        for i in range(5):
-            for j in range(i+1,5):
-                session.add(GraphEdge(id=f"eb{i}{j}", source_id=f"b{i}", target_id=f"b{j}", relation="LINKS", confidence=0.9, properties={"namespace":"public"}))
-        await session.commit()
+async def test_cluster_compute_and_summary(db_session):
+    # Seed small graph with two obvious clusters (A, B), each a dense K5 clique
+    node_rows = [
+        dict(id=f"{p}{i}", label="Entity", name=f"{name} {i}", namespace="public", properties={"namespace": "public"})
+        for p, name in (("a", "Alpha"), ("b", "Beta"))
+        for i in range(5)
+    ]
+    edge_rows = [
+        dict(id=f"e{p}{i}{j}", source_id=f"{p}{i}", target_id=f"{p}{j}", relation="LINKS", confidence=0.9, properties={"namespace": "public"})
+        for p in ("a", "b")
+        for i in range(5)
+        for j in range(i+1, 5)
+    ]
+    await db_session.execute(insert(GraphNode), node_rows)
+    await db_session.execute(insert(GraphEdge), edge_rows)
+    await db_session.commit()
     transport = httpx.ASGITransport(app=app)
     async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
         r = await client.get("/api/smart-assistant/graphrag/cluster?namespace=public&force=true")
@@ -1,5 +1,10 @@
+import pytest
+
 from scripts.run_graphrag_index import orchestrate
 
+# Index runs share graphrag_artifacts/.graphrag_index.lock; keep them on one xdist worker
+pytestmark = pytest.mark.xdist_group("graphrag_index")
+
 
 def test_orchestrate_dry_run(tmp_path, monkeypatch):
     # Ensure dry-run does not attempt import (still generates dummy artifacts)
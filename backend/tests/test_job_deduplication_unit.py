@@ -1,33 +1,87 @@
 import asyncio
 import pytest
+import pytest_asyncio
 
+from app.core import database
 from app.core.job_deduplication import job_deduplication_service
 from app.core.database import init_db, close_db
 from app.core.config import settings
 
 pytestmark = pytest.mark.asyncio
 
-async def test_filter_new_jobs_basic(tmp_path, monkeypatch):
-    # Use a temporary SQLite DB for this test
-    db_path = tmp_path / "test.db"
-    # Override runtime settings directly (settings object is created at import time)
-    settings.DATABASE_URL = f"sqlite:///{db_path}"
 
+@pytest_asyncio.fixture(scope="module", loop_scope="module", autouse=True)
+async def _dedup_db(tmp_path_factory):
+    # Point the app at a temporary SQLite DB for this module only, then restore
+    # the session-wide database (settings object is created at import time)
+    previous = (settings.DATABASE_URL, database.engine, database.async_session)
+    settings.DATABASE_URL = f"sqlite:///{tmp_path_factory.mktemp('dedup') / 'test.db'}"
     await init_db()
-    try:
-        jobs = [
-            {"title": "SE", "company": "A", "url": "https://x/jobs/1"},
-            {"title": "SE", "company": "B", "url": "https://x/jobs/2"},
-        ]
-        # Initially none processed
-        new_jobs = await job_deduplication_service.process_jobs_with_deduplication(jobs)
-        assert len(new_jobs) == 2
-
-        # Mark as processed
-        await job_deduplication_service.mark_jobs_as_processed(new_jobs)
-
-        # Next run should filter all
-        again = await job_deduplication_service.process_jobs_with_deduplication(jobs)
-        assert len(again) == 0
-    finally:
-        await close_db()
+    yield
+    await close_db()
+    settings.DATABASE_URL, database.engine, database.async_session = previous
+
+
+async def test_filter_new_jobs_basic():
+    jobs = [
+        {"title": "SE", "company": "A", "url": "https://x/jobs/1"},
+        {"title": "SE", "company": "B", "url": "https://x/jobs/2"},
+    ]
+    # Initially none processed
+    new_jobs = await job_deduplication_service.process_jobs_with_deduplication(jobs)
+    assert len(new_jobs) == 2
+
+    # Mark as processed
+    await job_deduplication_service.mark_jobs_as_processed(new_jobs)
+
+    # Next run should filter all
+    again = await job_deduplication_service.process_jobs_with_deduplication(jobs)
+    assert len(again) == 0
+
+async def test_near_duplicate_postings_filtered():
+    description = (
+        "We are looking for a backend engineer to design, build and operate "
+        "Python services on Kubernetes, own our Postgres data layer and mentor "
+        "junior developers across the platform team."
+    )
+    original = {"title": "Backend Engineer", "company": "Acme", "url": "https://x/jobs/10", "description": description}
+    cross_post = dict(original, url="https://y/postings/99", description=description + "!")
+    unrelated = {"title": "Designer", "company": "Acme", "url": "https://x/jobs/11",
+                 "description": "Own the visual language of our mobile apps and run weekly user research sessions with customers."}
+
+    new_jobs = await job_deduplication_service.process_jobs_with_deduplication([original, cross_post])
+    assert [j["url"] for j in new_jobs] == [original["url"]]
+
+    await job_deduplication_service.mark_jobs_as_processed(new_jobs)
+
+    again = await job_deduplication_service.process_jobs_with_deduplication([cross_post, unrelated])
+    assert [j["url"] for j in again] == [unrelated["url"]]
+
+
+async def test_urls_recorded_elsewhere_are_filtered():
+    # Another worker records the URL straight in the table, bypassing this service
+    from app.core.database import get_async_session
+    from app.models.database import ProcessedJobUrl
+    async with get_async_session() as session:
+        session.add(ProcessedJobUrl(url="https://x/jobs/31", job_title="SE", company="A"))
+        await session.commit()
+
+    jobs = [
+        {"title": "SE", "company": "A", "url": "https://x/jobs/31"},
+        {"title": "SE", "company": "B", "url": "https://x/jobs/32"},
+    ]
+    new_jobs = await job_deduplication_service.process_jobs_with_deduplication(jobs)
+    assert [j["url"] for j in new_jobs] == ["https://x/jobs/32"]
+
+
+async def test_processed_urls_track_inserts():
+    before = await job_deduplication_service.get_processed_urls()
+    jobs = [
+        {"title": "SE", "company": "A", "url": "https://x/jobs/21"},
+        {"title": "SE", "company": "B", "url": "https://x/jobs/22"},
+    ]
+    assert not before & {j["url"] for j in jobs}
+    await job_deduplication_service.mark_jobs_as_processed(jobs)
+
+    assert await job_deduplication_service.get_processed_urls() == before | {j["url"] for j in jobs}
+    assert await job_deduplication_service.get_processed_urls_count() == len(before) + 2
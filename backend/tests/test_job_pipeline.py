@@ -9,7 +9,9 @@ import asyncio
 import sys
 import os
 import json
+import tempfile
 from datetime import datetime
+from pathlib import Path
 import pytest
 
 # Add the backend directory to Python path
@@ -21,7 +23,8 @@ from dotenv import load_dotenv
 load_dotenv(os.path.join(backend_dir, '.env'))
 
 from app.core.linkedin_scraper_v2 import linkedin_scraper_v2
-from app.agents.job_agent import job_agent
+# The job agent is only needed by the live pipeline; without it the module skips
+job_agent = pytest.importorskip("app.agents.job_agent").job_agent
 import structlog
 
 # Configure logging
@@ -45,8 +48,9 @@ structlog.configure(
 logger = structlog.get_logger()
 
 
+@pytest.mark.skipif(not os.getenv("RUN_LIVE_TESTS"), reason="live network")
 @pytest.mark.asyncio
-async def test_complete_job_pipeline():
+async def test_complete_job_pipeline(tmp_path):
     """Test the complete job discovery and analysis pipeline."""
     
     print("🔄 Testing Complete Job Pipeline")
@@ -157,10 +161,8 @@ async def test_complete_job_pipeline():
             "user_profile": test_user_profile
         }
         
-        results_file = f"job_pipeline_test_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        
-        with open(results_file, 'w') as f:
-            json.dump(pipeline_results, f, indent=2, default=str)
+        results_file = tmp_path / "results.json"
+        results_file.write_text(json.dumps(pipeline_results, separators=(',', ':'), default=str))
         
         print(f"✅ Results saved to: {results_file}")
         
@@ -257,7 +259,7 @@ if __name__ == "__main__":
             return
         
         # Then test the complete pipeline
-        success = await test_complete_job_pipeline()
+        success = await test_complete_job_pipeline(Path(tempfile.mkdtemp(prefix="job_pipeline_test_")))
         
         if success:
             print("\n🎉 Complete job pipeline is working correctly!")
@@ -0,0 +1,33 @@
+import json
+
+import pytest
+
+from app.core.linkedin_scraper_v2 import LinkedInScraperV2
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_descriptions_fetched_in_one_browser_session():
+    scraper = LinkedInScraperV2()
+    scraper.websocket_endpoint = "wss://example.invalid"
+    scraper.rate_limit_delay = 0
+
+    scripts = []
+
+    async def fake_execute(script_content):
+        scripts.append(script_content)
+        line = next(l for l in script_content.splitlines() if l.startswith("const jobUrls = "))
+        urls = json.loads(line[len("const jobUrls = "):].rstrip(";"))
+        return [{"url": url, "description": f"Full description for {url} " * 5} for url in urls[:-1]]
+
+    scraper._execute_nodejs_script = fake_execute
+
+    jobs = [{"title": f"Job {i}", "url": f"https://www.linkedin.com/jobs/view/{i}"} for i in range(4)]
+    jobs.append({"title": "No URL"})
+    enhanced = await scraper.enhance_jobs_with_full_descriptions(jobs)
+
+    assert len(scripts) == 1
+    assert [job.get("description_source") for job in enhanced] == [
+        "full_page", "full_page", "full_page", "search_page", None
+    ]
+    assert enhanced[0]["description"].startswith("Full description for https://www.linkedin.com/jobs/view/0")
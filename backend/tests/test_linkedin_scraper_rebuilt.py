@@ -33,6 +33,7 @@ TEST_LIMIT = 10
 
 # --- Live Test Case ---
 
+@pytest.mark.skipif(not os.getenv("RUN_LIVE_TESTS"), reason="live network")
 @pytest.mark.asyncio
 async def test_live_job_scraping_and_data_validation():
     """
@@ -1,12 +1,6 @@
 from app.core.graphrag_query_adapter import query_adapter
 from app.core.graphrag_service import graphrag_service
-import pytest, asyncio
-from app.core import database as db
-
-@pytest.fixture(scope="module", autouse=True)
-def init_db():
-    asyncio.run(db.init_db())
-    yield
+import pytest
 
 @pytest.mark.asyncio
 async def test_query2_metrics_increment():
@@ -7,38 +7,354 @@ without the full Open WebUI dependency chain.
 """
 import sys
 import os
+import ast
 import asyncio
+import functools
+import io
+import itertools
 import json
-import importlib.util
+import marshal
+import math
+import mmap
+import pathlib
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
-def test_pipeline_function_structure(function_path, function_name):
+# Backend root on the path so the shared helpers import when run as a script
+sys.path.append(str(pathlib.Path(__file__).parent.parent))
+
+from tests._helpers import buffered_stdout
+
+
+def _load(path):
+    """Raw bytes and AST of a source file, parsed without executing it"""
+    data = pathlib.Path(path).read_bytes()
+    return data, ast.parse(data, filename=path)
+
+
+def _instance_attrs(init_node):
+    """Attributes assigned on self (the first argument) anywhere in __init__"""
+    if not init_node.args.args:
+        return set()
+    self_name = init_node.args.args[0].arg
+    attrs = set()
+    for node in ast.walk(init_node):
+        if isinstance(node, ast.Assign):
+            targets = node.targets
+        elif isinstance(node, (ast.AnnAssign, ast.AugAssign)):
+            targets = [node.target]
+        else:
+            continue
+        attrs.update(
+            t.attr for t in targets
+            if isinstance(t, ast.Attribute) and isinstance(t.value, ast.Name) and t.value.id == self_name
+        )
+    return attrs
+
+
+def _class_members(class_node):
+    """Names an instance would have: class-body assignments, methods, nested
+    classes and the attributes __init__ sets on self"""
+    members = set()
+    for node in class_node.body:
+        if isinstance(node, ast.Assign):
+            members.update(t.id for t in node.targets if isinstance(t, ast.Name))
+        elif isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name):
+            members.add(node.target.id)
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            members.add(node.name)
+            if node.name == '__init__' and isinstance(node, ast.FunctionDef):
+                members.update(_instance_attrs(node))
+    return members
+
+
+def _normalize_checks(checks):
+    """Freeze (name, pattern) pairs into (name, alternatives) at module load.
+
+    A pattern is a needle, a tuple (all of) or a list (any of); every form becomes
+    a tuple of alternatives, each a tuple of needles that must all be present.
+    """
+    def alternatives(pattern):
+        if isinstance(pattern, tuple):
+            return (pattern,)
+        if isinstance(pattern, list):
+            return tuple((p,) for p in pattern)
+        return ((pattern,),)
+    return tuple((name, alternatives(pattern)) for name, pattern in checks)
+
+
+def _needles(checks):
+    """Every literal needle of a normalized check table"""
+    return {n for _, alternatives in checks for alt in alternatives for n in alt}
+
+
+def _needle_scanner(checks):
+    """Build a scan(content) -> hits function covering every literal needle of `checks`.
+
+    One compiled regex finds all needles in a single pass. The alternation sits in a
+    lookahead so matches may overlap, and a needle that is a prefix of a longer one
+    at the same offset is credited from the longer hit.
+    """
+    needles = sorted(_needles(checks), key=len, reverse=True)
+    sep, wrap = (b'|', b'(?=(%s))') if isinstance(needles[0], bytes) else ('|', '(?=(%s))')
+    pattern = re.compile(wrap % sep.join(re.escape(n) for n in needles))
+    prefixes = {n: [p for p in needles if p != n and n.startswith(p)] for n in needles}
+    
+    def scan(content):
+        hits = set()
+        for match in pattern.finditer(content):
+            hits.add(match.group(1))
+            hits.update(prefixes[match.group(1)])
+        return hits
+    
+    return scan
+
+
+def _scan_mapped(path, scan):
+    """Run a needle scanner over a file through a read-only mmap, without copying it"""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:  # mmap cannot map an empty file
+            return scan(b'')
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return scan(mm)
+
+
+def _found(alternatives, hits):
+    return any(all(n in hits for n in alt) for alt in alternatives)
+
+
+# Key components of a pipeline file; the file is kept as bytes, so are the needles
+_CONTENT_CHECKS = _normalize_checks((
+    ('Pipeline class definition', b'class Pipeline:'),
+    ('Valves configuration', b'class Valves'),
+    ('Inlet method', b'async def inlet'),
+    ('Error handling', (b'try:', b'except')),
+    ('Logging', b'logger'),
+    ('HTTP requests', [b'aiohttp', b'requests']),
+    ('JSON processing', b'json'),
+    ('Smart Assistant integration', b'smart_assistant_url'),
+))
+_scan_content = _needle_scanner(_CONTENT_CHECKS)
+
+# Scanned straight from an mmap of the microservice file, so needles are bytes
+_INTEGRATION_CHECKS = _normalize_checks((
+    ('FastAPI app creation', b'@app.'),
+    ('Health endpoint', b'/health'),
+    ('Job discovery endpoint', b'/api/v1/jobs/discover'),
+    ('Inbox processing endpoint', b'/api/v1/inbox/process'),
+    ('Intelligence briefing endpoint', b'/api/v1/intelligence/briefing'),
+    ('CORS middleware', b'CORSMiddleware'),
+    ('Request/Response models', (b'class.*Request', b'class.*Response')),
+    ('Smart Assistant integration', b'smart-assistant'),
+))
+_scan_integration = _needle_scanner(_INTEGRATION_CHECKS)
+
+# Required model classes and essential database components of the models file
+_REQUIRED_MODELS = (
+    'SmartAssistantJob',
+    'SmartAssistantCareerProfile',
+    'SmartAssistantBriefing',
+    'SmartAssistantSystemStatus'
+)
+
+# Essential database components, in report order
+_MODEL_CHECKS = (
+    'SQLAlchemy imports',
+    'Base model import',
+    'Table definitions',
+    'Column definitions',
+    'Primary key',
+    'Foreign key',
+    'JSON fields',
+    'DateTime fields'
+)
+# Components satisfied by referencing a name (bare or as module attribute)
+_MODEL_NAME_CHECKS = {
+    'Column': 'Column definitions',
+    'ForeignKey': 'Foreign key',
+    'JSON': 'JSON fields',
+    'DateTime': 'DateTime fields'
+}
+
+
+def _model_facts(tree):
+    """(class names, satisfied component checks) of a models module, from one AST walk"""
+    classes, components = set(), set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ClassDef):
+            classes.add(node.name)
+            for stmt in node.body:
+                if isinstance(stmt, ast.Assign) and any(
+                    isinstance(t, ast.Name) and t.id == '__tablename__' for t in stmt.targets
+                ):
+                    components.add('Table definitions')
+        elif isinstance(node, ast.ImportFrom) and node.module:
+            if node.module.split('.')[0] == 'sqlalchemy':
+                components.add('SQLAlchemy imports')
+            elif node.module == 'open_webui.models.base':
+                components.add('Base model import')
+        elif isinstance(node, ast.Name) and node.id in _MODEL_NAME_CHECKS:
+            components.add(_MODEL_NAME_CHECKS[node.id])
+        elif isinstance(node, ast.Attribute) and node.attr in _MODEL_NAME_CHECKS:
+            components.add(_MODEL_NAME_CHECKS[node.attr])
+        elif (isinstance(node, ast.keyword) and node.arg == 'primary_key'
+              and isinstance(node.value, ast.Constant) and node.value.value is True):
+            components.add('Primary key')
+    return classes, components
+
+
+# Derived check facts per pipeline file, persisted across runs and keyed by
+# (st_mtime_ns, st_size); PIPELINE_TEST_CACHE=0 disables it
+_CHECK_CACHE_PATH = pathlib.Path(__file__).parent / ".cache" / "pipeline_checks.marshal"
+_CHECK_CACHE_NEEDLES = tuple(sorted(_needles(_CONTENT_CHECKS)))
+_CHECK_CACHE_VERSION = 2  # bump when the derived facts change meaning
+_check_cache_lock = threading.Lock()
+
+
+def _read_check_cache():
+    try:
+        with open(_CHECK_CACHE_PATH, 'rb') as f:
+            cache = marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return {}
+    # Facts recorded by an older format or against a different needle set are stale
+    if (not isinstance(cache, dict) or cache.get('version') != _CHECK_CACHE_VERSION
+            or cache.get('needles') != _CHECK_CACHE_NEEDLES):
+        return {}
+    return cache.get('files', {})
+
+
+def _write_check_cache(files):
+    _CHECK_CACHE_PATH.parent.mkdir(exist_ok=True)
+    tmp_path = _CHECK_CACHE_PATH.with_suffix('.tmp')
+    with open(tmp_path, 'wb') as f:
+        marshal.dump({'version': _CHECK_CACHE_VERSION, 'needles': _CHECK_CACHE_NEEDLES, 'files': files}, f)
+    os.replace(tmp_path, _CHECK_CACHE_PATH)
+
+
+@functools.lru_cache(maxsize=32)
+def _file_facts(path, mtime_ns, size):
+    """(Pipeline class members or None, content hits) for one version of a pipeline file.
+
+    Memoized in process per (path, mtime, size); the on-disk cache is only
+    consulted on a miss.
+    """
+    use_cache = os.environ.get('PIPELINE_TEST_CACHE', '1') == '1'
+    key = (mtime_ns, size)
+    
+    if use_cache:
+        with _check_cache_lock:
+            entry = _read_check_cache().get(path)
+        if entry is not None and entry[0] == key:
+            return entry[1], entry[2]
+    
+    data, tree = _load(path)
+    classes = {node.name: node for node in tree.body if isinstance(node, ast.ClassDef)}
+    members = frozenset(_class_members(classes['Pipeline'])) if 'Pipeline' in classes else None
+    hits = frozenset(_scan_content(data))
+    
+    if use_cache:
+        with _check_cache_lock:
+            files = _read_check_cache()
+            files[path] = (key, members, hits)
+            _write_check_cache(files)
+    return members, hits
+
+
+def _pipeline_facts(path, st=None):
+    """(Pipeline class members or None, content hits) for a pipeline file"""
+    st = st or os.stat(path)
+    return _file_facts(path, st.st_mtime_ns, st.st_size)
+
+
+def _score_checks(checks, total, pass_rate):
+    """Report (ok_line, fail_line, found) checks until the pass threshold is decided.
+
+    `checks` may be a lazy iterable; evaluation stops as soon as the threshold is
+    met or can no longer be reached. Returns (passed, checked, ok).
+    """
+    threshold = math.ceil(total * pass_rate)
+    passed = checked = 0
+    for ok_line, fail_line, found in checks:
+        checked += 1
+        if found:
+            print(f"   ✅ {ok_line}")
+            passed += 1
+        else:
+            print(f"   {fail_line}")
+        if passed >= threshold or passed + (total - checked) < threshold:
+            break
+    return passed, checked, passed >= threshold
+
+
+def _score_line(label, passed, checked, total):
+    if checked < total:
+        return f"   📊 {label} Score: {passed}/{checked} (decided after {checked} of {total} checks)"
+    return f"   📊 {label} Score: {passed}/{total}"
+
+
+def _validate_pipeline(func_path, func_name):
+    """Structure and content checks for one pipeline file"""
+    # One stat serves the existence check and every cache key below
+    try:
+        st = os.stat(func_path)
+    except FileNotFoundError:
+        print(f"   ❌ {func_name} file not found at {func_path}")
+        return False
+    members, hits = _pipeline_facts(func_path, st)
+    structure_ok = _check_structure(members, func_name)
+    content_ok = _check_content(hits, func_name)
+    return structure_ok and content_ok
+
+
+# Checks run on worker threads; each thread's prints go to its own buffer so
+# the report can be replayed in order once all of them finish
+_task_output = threading.local()
+
+
+class _PerThreadStdout:
+    """sys.stdout stand-in routing writes to the calling thread's task buffer"""
+
+    def __init__(self, fallback):
+        self._fallback = fallback
+
+    def write(self, text):
+        return getattr(_task_output, 'buffer', self._fallback).write(text)
+
+    def flush(self):
+        self._fallback.flush()
+
+
+def _run_captured(task):
+    _task_output.buffer = io.StringIO()
+    try:
+        return task(), _task_output.buffer.getvalue()
+    finally:
+        del _task_output.buffer
+
+
+def _check_structure(members, function_name):
     """Test that a pipeline function has the correct structure"""
     print(f"\n🔍 Testing {function_name} Structure...")
     
     try:
-        # Load the module directly
-        spec = importlib.util.spec_from_file_location("pipeline_module", function_path)
-        module = importlib.util.module_from_spec(spec)
-        
-        # Execute the module
-        spec.loader.exec_module(module)
-        
-        # Check if Pipeline class exists
-        if hasattr(module, 'Pipeline'):
-            pipeline_class = getattr(module, 'Pipeline')
+        # Members come from the module's AST rather than an import, so the
+        # pipeline's imports and top-level side effects never run
+        if members is not None:
             print(f"   ✅ Pipeline class found")
             
             # Check required attributes
             required_attrs = ['id', 'name', 'valves']
             for attr in required_attrs:
-                if hasattr(pipeline_class, attr):
+                if attr in members:
                     print(f"   ✅ Has '{attr}' attribute")
                 else:
                     print(f"   ❌ Missing '{attr}' attribute")
                     return False
             
             # Check for inlet method
-            if hasattr(pipeline_class, 'inlet'):
+            if 'inlet' in members:
                 print(f"   ✅ Has 'inlet' method")
             else:
                 print(f"   ❌ Missing 'inlet' method")
@@ -54,44 +370,20 @@ def test_pipeline_function_structure(function_path, function_name):
         print(f"   ❌ Error loading {function_name}: {e}")
         return False
 
-def test_pipeline_function_content(function_path, function_name):
+def _check_content(hits, function_name):
     """Test the content and trigger detection logic"""
     print(f"\n📝 Testing {function_name} Content...")
     
     try:
-        # Read the file content
-        with open(function_path, 'r') as f:
-            content = f.read()
-        
-        # Check for key components
-        checks = {
-            'Pipeline class definition': 'class Pipeline:',
-            'Valves configuration': 'class Valves',
-            'Inlet method': 'async def inlet',
-            'Error handling': 'try:' and 'except',
-            'Logging': 'logger',
-            'HTTP requests': 'aiohttp' or 'requests',
-            'JSON processing': 'json',
-            'Smart Assistant integration': 'smart_assistant_url'
-        }
+        total = len(_CONTENT_CHECKS)
+        checks = (
+            (check_name, f"⚠️  {check_name} (not found)", _found(pattern, hits))
+            for check_name, pattern in _CONTENT_CHECKS
+        )
+        passed, checked, ok = _score_checks(checks, total, 0.7)  # 70% pass rate
         
-        passed = 0
-        total = len(checks)
-        
-        for check_name, pattern in checks.items():
-            if isinstance(pattern, str):
-                found = pattern in content
-            else:
-                found = any(p in content for p in pattern)
-            
-            if found:
-                print(f"   ✅ {check_name}")
-                passed += 1
-            else:
-                print(f"   ⚠️  {check_name} (not found)")
-        
-        print(f"   📊 Content Score: {passed}/{total}")
-        return passed >= total * 0.7  # 70% pass rate
+        print(_score_line("Content", passed, checked, total))
+        return ok
         
     except Exception as e:
         print(f"   ❌ Error reading {function_name}: {e}")
@@ -104,39 +396,17 @@ def test_microservice_integration():
     microservice_path = "/home/gabe/Documents/Agent Project 2.0/smart-assistant-microservice.py"
     
     try:
-        with open(microservice_path, 'r') as f:
-            content = f.read()
-        
-        integration_checks = {
-            'FastAPI app creation': '@app.',
-            'Health endpoint': '/health',
-            'Job discovery endpoint': '/api/v1/jobs/discover',
-            'Inbox processing endpoint': '/api/v1/inbox/process',
-            'Intelligence briefing endpoint': '/api/v1/intelligence/briefing',
-            'CORS middleware': 'CORSMiddleware',
-            'Request/Response models': ('class.*Request', 'class.*Response'),
-            'Smart Assistant integration': 'smart-assistant'
-        }
+        hits = _scan_mapped(microservice_path, _scan_integration)
         
-        passed = 0
-        total = len(integration_checks)
-        
-        for check_name, pattern in integration_checks.items():
-            if isinstance(pattern, tuple):
-                found = all(p in content for p in pattern)
-            elif isinstance(pattern, str):
-                found = pattern in content
-            else:
-                found = False
-            
-            if found:
-                print(f"   ✅ {check_name}")
-                passed += 1
-            else:
-                print(f"   ⚠️  {check_name}")
+        total = len(_INTEGRATION_CHECKS)
+        checks = (
+            (check_name, f"⚠️  {check_name}", _found(pattern, hits))
+            for check_name, pattern in _INTEGRATION_CHECKS
+        )
+        passed, checked, ok = _score_checks(checks, total, 0.8)  # 80% pass rate
         
-        print(f"   📊 Integration Score: {passed}/{total}")
-        return passed >= total * 0.8  # 80% pass rate
+        print(_score_line("Integration", passed, checked, total))
+        return ok
         
     except Exception as e:
         print(f"   ❌ Error testing microservice: {e}")
@@ -154,54 +424,32 @@ def test_database_models():
             print(f"   ❌ Models file not found at {models_path}")
             return False
         
-        with open(models_path, 'r') as f:
-            content = f.read()
-        
-        # Check for required model definitions
-        required_models = [
-            'SmartAssistantJob',
-            'SmartAssistantCareerProfile', 
-            'SmartAssistantBriefing',
-            'SmartAssistantSystemStatus'
-        ]
+        # Structural checks on the AST, so strings and comments cannot match
+        _, tree = _load(models_path)
+        classes, components = _model_facts(tree)
         
-        model_checks = {
-            'SQLAlchemy imports': 'from sqlalchemy',
-            'Base model import': 'from open_webui.models.base',
-            'Table definitions': '__tablename__',
-            'Column definitions': 'Column',
-            'Primary key': 'primary_key=True',
-            'Foreign key': 'ForeignKey',
-            'JSON fields': 'JSON',
-            'DateTime fields': 'DateTime'
-        }
+        total = len(_REQUIRED_MODELS) + len(_MODEL_CHECKS)
+        # Model classes first, then essential database components
+        checks = itertools.chain(
+            (
+                (f"{model_name} model defined", f"❌ {model_name} model missing", model_name in classes)
+                for model_name in _REQUIRED_MODELS
+            ),
+            (
+                (check_name, f"⚠️  {check_name}", check_name in components)
+                for check_name in _MODEL_CHECKS
+            ),
+        )
+        passed, checked, ok = _score_checks(checks, total, 0.8)  # 80% pass rate
         
-        passed = 0
-        total = len(required_models) + len(model_checks)
-        
-        # Check for model classes
-        for model_name in required_models:
-            if f"class {model_name}" in content:
-                print(f"   ✅ {model_name} model defined")
-                passed += 1
-            else:
-                print(f"   ❌ {model_name} model missing")
-        
-        # Check for essential database components
-        for check_name, pattern in model_checks.items():
-            if pattern in content:
-                print(f"   ✅ {check_name}")
-                passed += 1
-            else:
-                print(f"   ⚠️  {check_name}")
-        
-        print(f"   📊 Database Models Score: {passed}/{total}")
-        return passed >= total * 0.8  # 80% pass rate
+        print(_score_line("Database Models", passed, checked, total))
+        return ok
         
     except Exception as e:
         print(f"   ❌ Database models test failed: {e}")
         return False
 
+@buffered_stdout()
 def main():
     """Run simplified Phase 1 tests"""
     print("🚀 Phase 1 Simplified Integration Tests")
@@ -216,21 +464,25 @@ def main():
         ("/home/gabe/Documents/Agent Project 2.0/backend/open_webui/functions/intelligence_briefing.py", "Intelligence Briefing Pipeline")
     ]
     
-    # Test function structure
-    for func_path, func_name in pipeline_functions:
-        if os.path.exists(func_path):
-            structure_ok = test_pipeline_function_structure(func_path, func_name)
-            content_ok = test_pipeline_function_content(func_path, func_name)
-            results.append(structure_ok and content_ok)
-        else:
-            print(f"   ❌ {func_name} file not found at {func_path}")
-            results.append(False)
+    # Pipeline files, microservice integration and database models are
+    # independent checks, so run them side by side
+    tasks = [
+        functools.partial(_validate_pipeline, func_path, func_name)
+        for func_path, func_name in pipeline_functions
+    ]
+    tasks += [test_microservice_integration, test_database_models]
     
-    # Test microservice integration
-    results.append(test_microservice_integration())
+    stdout = sys.stdout
+    sys.stdout = _PerThreadStdout(stdout)
+    try:
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            outcomes = list(executor.map(_run_captured, tasks))
+    finally:
+        sys.stdout = stdout
     
-    # Test database models
-    results.append(test_database_models())
+    for ok, output in outcomes:
+        print(output, end='')
+        results.append(ok)
     
     # Summary
     print("\n" + "=" * 50)
@@ -0,0 +1,59 @@
+import asyncio
+
+import pytest
+
+from app.api import smart_assistant
+from app.core.config import settings
+
+pytestmark = pytest.mark.asyncio
+
+
+class _FakeGemini:
+    def __init__(self):
+        self.in_flight = 0
+        self.peak = 0
+        self.cover_letters = []
+
+    def is_configured(self):
+        return True
+
+    async def _track(self):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+
+    async def analyze_job_posting(self, description):
+        await self._track()
+        score = 0.9 if "good" in description else 0.1
+        return {"success": True, "analysis": {"relevance_score": score}}
+
+    async def generate_cover_letter(self, job_title, company, job_description):
+        await self._track()
+        self.cover_letters.append(job_title)
+        return {"success": True, "cover_letter": f"Dear {company}"}
+
+
+class _PassThroughDedup:
+    async def process_jobs_with_deduplication(self, jobs):
+        return jobs
+
+
+async def test_process_jobs_runs_gemini_calls_concurrently(monkeypatch):
+    fake = _FakeGemini()
+    monkeypatch.setattr(smart_assistant, "gemini_client", fake)
+    monkeypatch.setattr(smart_assistant, "job_deduplication_service", _PassThroughDedup())
+    monkeypatch.setattr(settings, "GEMINI_MAX_CONCURRENCY", 3)
+
+    jobs = [
+        {"title": f"Role {i}", "company": "Acme", "description": "good fit" if i % 2 == 0 else "poor fit"}
+        for i in range(10)
+    ]
+    result = await smart_assistant.process_jobs_with_ai(
+        jobs, generate_cover_letters=True, save_to_airtable=False, min_relevance_score=0.7
+    )
+
+    assert result["total_processed"] == 10
+    assert result["high_relevance_jobs"] == 5
+    assert 1 < fake.peak <= 3
+    assert sorted(fake.cover_letters) == sorted(f"Role {i}" for i in range(0, 10, 2))
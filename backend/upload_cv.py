@@ -6,10 +6,53 @@ This script helps you quickly upload your CV PDF to the correct location
 for the Smart Assistant job pipeline.
 """
 
+import errno
+import os
 import sys
 import shutil
 from pathlib import Path
 
+COPY_BUFFER_SIZE = 1 << 20
+
+def _copy_file(src: Path, dst: Path) -> None:
+    """Copy src to dst in-kernel where possible, preserving metadata like shutil.copy2"""
+    try:
+        with open(src, 'rb') as s, open(dst, 'wb') as d:
+            remaining = os.fstat(s.fileno()).st_size
+            while remaining > 0:
+                copied = os.copy_file_range(s.fileno(), d.fileno(), remaining)
+                if copied == 0:
+                    # Some kernels and virtual/FUSE filesystems report 0 instead of
+                    # failing; treat a short copy as unsupported
+                    raise OSError(errno.ENOTSUP, "copy_file_range copied nothing")
+                remaining -= copied
+    except (AttributeError, OSError):
+        # No copy_file_range (non-Linux) or unsupported across these filesystems:
+        # one unbuffered pass with 1 MiB chunks, rewriting dst from the start
+        with open(src, 'rb', buffering=0) as s, open(dst, 'wb', buffering=0) as d:
+            shutil.copyfileobj(s, d, length=COPY_BUFFER_SIZE)
+    shutil.copystat(src, dst)
+
+def _backup_file(src: Path, backup_path: Path) -> Path:
+    """Keep a copy of src at backup_path (or a numbered variant) and return where it went"""
+    candidate = backup_path
+    counter = 1
+    while candidate.exists():
+        # An interrupted earlier run may have left the link already
+        if os.path.samefile(src, candidate):
+            return candidate
+        candidate = backup_path.with_stem(f"{backup_path.stem}_{counter}")
+        counter += 1
+    # A hard link keeps the old file without copying it
+    try:
+        os.link(src, candidate)
+    except OSError as e:
+        # Cross-device or no hard-link support on this filesystem
+        if e.errno not in (errno.EXDEV, errno.EPERM):
+            raise
+        _copy_file(src, candidate)
+    return candidate
+
 def main():
     if len(sys.argv) != 2:
         print("Usage: python upload_cv.py <path_to_your_cv.pdf>")
@@ -35,15 +78,29 @@ def main():
     # Create directory if it doesn't exist
     cv_dir.mkdir(parents=True, exist_ok=True)
     
+    # Stage the new CV in the same directory so it can be swapped in with a rename
+    cv_staging = cv_dir / "cv.pdf.tmp"
+    try:
+        _copy_file(cv_source, cv_staging)
+    except Exception as e:
+        cv_staging.unlink(missing_ok=True)
+        print(f"Error copying CV file: {e}")
+        sys.exit(1)
+    
     # Backup existing CV if it exists
     if cv_destination.exists():
         backup_path = cv_dir / f"cv_backup_{int(cv_destination.stat().st_mtime)}.pdf"
-        shutil.copy2(cv_destination, backup_path)
+        try:
+            backup_path = _backup_file(cv_destination, backup_path)
+        except Exception as e:
+            cv_staging.unlink(missing_ok=True)
+            print(f"Error backing up existing CV: {e}")
+            sys.exit(1)
         print(f"Backed up existing CV to: {backup_path}")
     
-    # Copy new CV
+    # Swap in the new CV
     try:
-        shutil.copy2(cv_source, cv_destination)
+        os.replace(cv_staging, cv_destination)
         print(f"✅ CV uploaded successfully!")
         print(f"   Source: {cv_source}")
         print(f"   Destination: {cv_destination}")